@@ -0,0 +1,8 @@
+// Copyright (c) 2026, alipro and contributors
+// For license information, please see license.txt
+
+// frappe.ui.form.on("Bill Notification", {
+// 	refresh(frm) {
+
+// 	},
+// });
@@ -0,0 +1,11 @@
+# Copyright (c) 2026, alipro and contributors
+# For license information, please see license.txt
+
+# import frappe
+from frappe.model.document import Document
+
+
+class ElectricityConsumptionSummary(Document):
+	def autoname(self):
+		"""Name the summary after its (electricity_type, period) key"""
+		self.name = f"{self.electricity_type}-{self.period}"
@@ -1,8 +1,42 @@
 // Copyright (c) 2025, alipro and contributors
 // For license information, please see license.txt
 
-// frappe.ui.form.on("Electricity Type", {
-// 	refresh(frm) {
+frappe.ui.form.on("Electricity Type", {
+	refresh(frm) {
+		if (frm.is_new()) return;
 
-// 	},
-// });
+		frm.add_custom_button(__("Generate Statements"), function () {
+			frappe.prompt(
+				[
+					{
+						fieldname: "from_date",
+						label: __("From Date"),
+						fieldtype: "Date",
+						reqd: 1,
+						default: frappe.datetime.month_start(),
+					},
+					{
+						fieldname: "to_date",
+						label: __("To Date"),
+						fieldtype: "Date",
+						reqd: 1,
+						default: frappe.datetime.month_end(),
+					},
+				],
+				function (values) {
+					frappe.call({
+						method: "electricity_meter_management.electricity_meter_management.services.statements.enqueue_electricity_type_statements",
+						args: {
+							electricity_type: frm.doc.name,
+							from_date: values.from_date,
+							to_date: values.to_date,
+						},
+						freeze: true,
+					});
+				},
+				__("Generate Statements"),
+				__("Generate")
+			);
+		});
+	},
+});
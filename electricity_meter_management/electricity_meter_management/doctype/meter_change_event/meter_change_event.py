@@ -0,0 +1,51 @@
+# Copyright (c) 2026, alipro and contributors
+# For license information, please see license.txt
+
+import frappe
+from frappe import _
+from frappe.model.document import Document
+
+from electricity_meter_management.electricity_meter_management.services.customer import (
+	validate_meter_number_is_free,
+)
+
+
+class MeterChangeEvent(Document):
+	def validate(self):
+		"""Validate the document before saving"""
+		if self.meter_movement and (
+			self.has_value_changed("old_final_reading") or self.has_value_changed("new_initial_reading")
+		):
+			frappe.throw(
+				_("Meter Change Event {0} is already billed in {1}").format(self.name, self.meter_movement)
+			)
+
+		# a Meter Movement row bills a single event
+		pending_event = not self.meter_movement and frappe.db.exists(
+			"Meter Change Event",
+			{"customer": self.customer, "meter_movement": ["is", "not set"], "name": ["!=", self.name]},
+		)
+		if pending_event:
+			frappe.throw(
+				_("Customer {0} already has Meter Change Event {1} that is not billed yet").format(
+					self.customer, pending_event
+				)
+			)
+
+		if self.event_type == "Replacement" and not self.new_meter_number:
+			frappe.throw(_("New meter number is required for a meter replacement"))
+
+		if self.is_new() and self.event_type == "Replacement":
+			# after_insert moves the customer to the new meter without running Customer.validate
+			validate_meter_number_is_free(self.new_meter_number, self.customer)
+
+	def after_insert(self):
+		"""Point the customer at the new meter after a replacement"""
+		if self.event_type == "Replacement" and self.new_meter_number:
+			frappe.db.set_value("Customer", self.customer, "custom_meter_number", self.new_meter_number)
+
+	def on_trash(self):
+		if self.meter_movement:
+			frappe.throw(
+				_("Meter Change Event {0} is already billed in {1}").format(self.name, self.meter_movement)
+			)
@@ -2,6 +2,22 @@
 // For license information, please see license.txt
 
 frappe.ui.form.on("Meter Movement", {
+    setup(frm) {
+        // Progress of bulk Sales Invoice jobs for this document
+        frappe.realtime.on("meter_movement_job_progress", function (data) {
+            if (data.meter_movement !== frm.doc.name) return;
+
+            if (data.status === "Completed" || data.status === "Failed") {
+                frappe.hide_progress();
+                show_job_summary(data.job);
+                frm.reload_doc();
+            } else {
+                frappe.show_progress(__(data.action), data.processed, data.total,
+                    __("{0} of {1} rows processed", [data.processed, data.total]));
+            }
+        });
+    },
+
     refresh(frm) {
         // Show "جلب العملاء" button for new documents or documents that are not submitted
         if (frm.doc.docstatus !== 1) {
@@ -52,6 +68,36 @@ frappe.ui.form.on("Meter Movement", {
                 print_selected_rows(frm);
             });
 
+            // Submit deferred draft Sales Invoices in a background batch; "In Progress" is
+            // offered too so a run that died can be restarted (a running job is not duplicated)
+            if (frm.doc.docstatus === 1 && frm.doc.defer_invoice_submit
+                && ['Pending', 'Partly Failed', 'In Progress'].includes(frm.doc.invoice_submission_status)) {
+                frm.add_custom_button(__('Submit Draft Invoices'), function () {
+                    frappe.call({
+                        method: "electricity_meter_management.electricity_meter_management.services.invoicing.enqueue_draft_invoice_submission",
+                        args: { meter_movement_name: frm.doc.name },
+                        freeze: true,
+                        callback: function () {
+                            frm.reload_doc();
+                        }
+                    });
+                });
+            }
+
+            // Create the Sales Invoices still missing, in a background job
+            if (frm.doc.docstatus === 1 && !frm.doc.defer_invoice_submit) {
+                frm.add_custom_button(__('Create Missing Sales Invoices'), function () {
+                    frappe.call({
+                        method: "electricity_meter_management.electricity_meter_management.doctype.meter_movement.meter_movement.create_sales_invoices_for_meter_movement",
+                        args: { meter_movement_name: frm.doc.name },
+                        freeze: true,
+                        callback: function () {
+                            frappe.show_alert({ message: __("Sales Invoice job queued"), indicator: 'blue' });
+                        }
+                    });
+                });
+            }
+
             // View Sales Invoices button (only for submitted documents)
             if (frm.doc.docstatus === 1) {
                 frm.add_custom_button(__('عرض فواتير المبيعات'), function () {
@@ -104,10 +150,11 @@ function compute_difference_and_total(frm, cdt, cdn) {
     var price = parseFloat(row.price) || 0;
 
     var diff = cur - prev;
-    // Prevent negative difference: if current < previous, set diff to 0 and show a warning
+    // Current below previous means a meter replacement or rollover: the server computes
+    // the consumption on save from Meter Change Events or the meter's digit capacity
     if (diff < 0) {
         diff = 0;
-        frappe.show_alert({ message: __('القراءة الحالية أصغر من القراءة السابقة — تم ضبط الفرق إلى 0'), indicator: 'yellow' });
+        frappe.show_alert({ message: __('Current reading is lower than previous reading. Consumption will be calculated on save from meter change events or meter rollover.'), indicator: 'yellow' });
     }
 
     row.difference = isNaN(diff) ? 0 : diff;
@@ -201,3 +248,40 @@ function generate_bill_html(r, parent) {
     html += '</div>';
     return html;
 }
+
+function show_job_summary(job_name) {
+    frappe.call({
+        method: "electricity_meter_management.electricity_meter_management.services.jobs.get_job_summary",
+        args: { job_name: job_name },
+        callback: function (r) {
+            var summary = r.message;
+            if (!summary) return;
+
+            var html = '<p>' + __("Succeeded: {0}, Skipped: {1}, Failed: {2}",
+                [summary.succeeded || 0, summary.skipped || 0, summary.failed || 0]) + '</p>';
+            if (summary.error) {
+                html += '<p class="text-danger">' + frappe.utils.escape_html(summary.error) + '</p>';
+            }
+            if (summary.rows.length) {
+                html += '<table class="table table-bordered"><thead><tr>'
+                    + '<th>' + __("Row") + '</th><th>' + __("Customer") + '</th><th>' + __("Status") + '</th>'
+                    + '<th>' + __("Sales Invoice") + '</th><th>' + __("Reason") + '</th></tr></thead><tbody>';
+                summary.rows.forEach(function (row) {
+                    html += '<tr><td>' + row.row_idx + '</td>'
+                        + '<td>' + frappe.utils.escape_html(row.customer || '') + '</td>'
+                        + '<td>' + __(row.status) + '</td>'
+                        + '<td>' + frappe.utils.escape_html(row.sales_invoice || '') + '</td>'
+                        + '<td>' + frappe.utils.escape_html(row.reason || '') + '</td></tr>';
+                });
+                html += '</tbody></table>';
+            }
+
+            frappe.msgprint({
+                title: __(summary.action),
+                message: html,
+                indicator: summary.failed || summary.status === "Failed" ? 'orange' : 'green',
+                wide: true
+            });
+        }
+    });
+}
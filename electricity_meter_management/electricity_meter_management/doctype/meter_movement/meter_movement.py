@@ -4,12 +4,31 @@
 import frappe
 from frappe import _
 from frappe.model.document import Document
+from frappe.utils import cint
 
 
 class MeterMovement(Document):
 	def validate(self):
 		"""Validate the document before saving"""
+		from electricity_meter_management.electricity_meter_management.services.meter_changes import (
+			calculate_meter_movement_rows,
+		)
+
 		self.validate_customer_table()
+		calculate_meter_movement_rows(self)
+		# reading edits are audited in Meter Reading Log instead of whole-document versions
+		self.flags.ignore_version = True
+
+	def on_update(self):
+		self.log_reading_changes()
+
+	def log_reading_changes(self):
+		"""Record changed current readings in the reading audit trail"""
+		from electricity_meter_management.electricity_meter_management.services.reading_audit import (
+			log_reading_changes,
+		)
+
+		log_reading_changes(self)
 
 	def validate_customer_table(self):
 		"""Validate customer table data"""
@@ -32,104 +51,161 @@ class MeterMovement(Document):
 		"""When Meter Movement is submitted, update Customer.custom_meter_reading
 		and create Sales Invoices for each customer.
 		"""
+		# Submit runs on_submit instead of on_update, so readings edited in this save are logged here
+		self.log_reading_changes()
+
 		if not getattr(self, 'customer_table', None):
 			return
 
-		# Update customer meter readings and create sales invoices
-		for row in self.customer_table:
-			# Update customer meter reading
-			self.update_customer_meter_reading(row)
-			# Create sales invoice for this customer
-			self.create_sales_invoice_for_customer(row)
+		# Service modules are imported on first use to keep worker boot cheap
+		from electricity_meter_management.electricity_meter_management.services.consumption_summary import (
+			apply_meter_movement,
+		)
+		from electricity_meter_management.electricity_meter_management.services.invoicing import (
+			create_draft_sales_invoices,
+		)
+		from electricity_meter_management.electricity_meter_management.services.meter_changes import (
+			link_meter_change_events,
+		)
+		from electricity_meter_management.electricity_meter_management.services.notifications import (
+			enqueue_bill_notifications,
+		)
+
+		self.update_customer_meter_readings()
+
+		if self.defer_invoice_submit:
+			# invoices are submitted later in batch
+			create_draft_sales_invoices(self)
+		else:
+			for row in self.customer_table:
+				self.create_sales_invoice_for_customer(row, link=False)
+			self.link_sales_invoices()
+			frappe.msgprint(_("Created {0} Sales Invoices").format(len(self.customer_table)))
+
+		link_meter_change_events(self)
+		apply_meter_movement(self)
+		enqueue_bill_notifications(self)
 
 	def cancel(self):
 		"""Override cancel to handle circular dependency with Sales Invoices"""
-		if getattr(self, 'customer_table', None):
-			for row in self.customer_table:
-				sales_invoice_name = row.get("custom_sales_invoice")
-				if sales_invoice_name:
-					# 1. Force Break Link from Child Table -> Sales Invoice using SQL
-					frappe.db.sql("""
-						UPDATE `tabMeter Movement Table`
-						SET custom_sales_invoice = NULL
-						WHERE name = %s
-					""", (row.name,))
-					
-					try:
-						# 2. Force Break Link from Sales Invoice -> Meter Movement using SQL
-						frappe.db.sql("""
-							UPDATE `tabSales Invoice`
-							SET custom_meter_movement = NULL, custom_meter_movement_row = NULL
-							WHERE name = %s
-						""", (sales_invoice_name,))
-
-						if frappe.db.get_value("Sales Invoice", sales_invoice_name, "docstatus") == 1:
-							si = frappe.get_doc("Sales Invoice", sales_invoice_name)
-							si.ignore_links = True
-							si.flags.ignore_links = True
-							si.flags.ignore_validate = True
-							# Avoid recursive loop if SI tries to update MM
-							si.flags.from_meter_movement_cancel = True 
-							si.cancel()
-					except Exception as e:
-						# If cancellation fails, we still want to allow this document to be cancelled if possible,
-						# but ideally we should rollback. However, since we already broke links, we might leave orphans.
-						# For now, we throw to let the user know, but give a clear message.
-						frappe.throw(_("Could not cancel linked Sales Invoice {0}. Error: {1}").format(sales_invoice_name, str(e)))
+		rows = [row for row in (getattr(self, 'customer_table', None) or []) if row.get("custom_sales_invoice")]
+		if rows:
+			sales_invoice_names = [row.custom_sales_invoice for row in rows]
+
+			# 1. Force Break Link from Child Table -> Sales Invoice using SQL
+			frappe.db.sql("""
+				UPDATE `tabMeter Movement Table`
+				SET custom_sales_invoice = NULL
+				WHERE name IN %(rows)s
+			""", {"rows": tuple(row.name for row in rows)})
+
+			# 2. Force Break Link from Sales Invoice -> Meter Movement using SQL
+			frappe.db.sql("""
+				UPDATE `tabSales Invoice`
+				SET custom_meter_movement = NULL, custom_meter_movement_row = NULL
+				WHERE name IN %(sales_invoices)s
+			""", {"sales_invoices": tuple(sales_invoice_names)})
+
+			docstatuses = get_sales_invoice_docstatuses(sales_invoice_names)
+			for sales_invoice_name in sales_invoice_names:
+				try:
+					si_docstatus = docstatuses.get(sales_invoice_name)
+					if si_docstatus == 1:
+						si = frappe.get_doc("Sales Invoice", sales_invoice_name)
+						si.ignore_links = True
+						si.flags.ignore_links = True
+						si.flags.ignore_validate = True
+						# Avoid recursive loop if SI tries to update MM
+						si.flags.from_meter_movement_cancel = True 
+						si.cancel()
+					elif si_docstatus == 0:
+						# Draft left by deferred submission: nothing was posted, just remove it
+						frappe.delete_doc("Sales Invoice", sales_invoice_name, ignore_permissions=True)
+				except Exception as e:
+					# If cancellation fails, we still want to allow this document to be cancelled if possible,
+					# but ideally we should rollback. However, since we already broke links, we might leave orphans.
+					# For now, we throw to let the user know, but give a clear message.
+					frappe.throw(_("Could not cancel linked Sales Invoice {0}. Error: {1}").format(sales_invoice_name, str(e)))
 
 		super(MeterMovement, self).cancel()
 
 	def on_cancel(self):
 		"""When Meter Movement is cancelled, cancel all related Sales Invoices and revert readings"""
+		from electricity_meter_management.electricity_meter_management.services.consumption_summary import (
+			apply_meter_movement,
+		)
+		from electricity_meter_management.electricity_meter_management.services.meter_changes import (
+			link_meter_change_events,
+		)
+		from electricity_meter_management.electricity_meter_management.services.notifications import (
+			cancel_bill_notifications,
+		)
+
 		self.cancel_related_sales_invoices()
 		self.revert_all_customer_meter_readings()
+		link_meter_change_events(self, cancel=True)
+		apply_meter_movement(self, sign=-1)
+		cancel_bill_notifications(self)
 
 	def revert_all_customer_meter_readings(self):
-		"""Revert all customers' meter readings to previous values"""
+		"""Revert all customers' meter readings to previous values, in one statement"""
 		if not getattr(self, 'customer_table', None):
 			return
 
-		for row in self.customer_table:
-			self.revert_customer_meter_reading(row)
-
-	def revert_customer_meter_reading(self, row):
-		"""Revert customer's meter reading to previous value"""
-		cust = getattr(row, 'customer_name', None) or getattr(row, 'customer_no', None)
-		if not cust:
-			return
-
-		# Revert to previous reading
-		prev = getattr(row, 'previous_reading', 0)
-		
-		try:
-			# Update the customer's custom meter reading
-			frappe.db.set_value('Customer', cust, 'custom_meter_reading', prev, update_modified=False)
-		except Exception as e:
-			frappe.log_error(message=f"Failed reverting custom_meter_reading for {cust}: {e}", title="MeterMovement.revert_customer_meter_reading")
+		self.set_customer_meter_readings("previous_reading")
 
 	def on_update_after_submit(self):
 		"""When Meter Movement is updated after submit, update related Sales Invoices"""
 		self.update_related_sales_invoices()
 
-	def update_customer_meter_reading(self, row):
-		"""Update customer's meter reading"""
-		# determine customer identifier: prefer linked Customer field `customer_name`
-		cust = getattr(row, 'customer_name', None) or getattr(row, 'customer_no', None)
-		if not cust:
-			return
+	def update_customer_meter_readings(self):
+		"""Update customers' meter readings to the current readings, in one statement"""
+		self.set_customer_meter_readings("current_reading")
 
-		cur = getattr(row, 'current_reading', None)
-		if cur is None:
-			return
+	def set_customer_meter_readings(self, reading_field):
+		"""Write each row's `reading_field` to its customer's custom_meter_reading"""
+		readings = {}
+		for row in self.customer_table:
+			# determine customer identifier: prefer linked Customer field `customer_name`
+			cust = getattr(row, 'customer_name', None) or getattr(row, 'customer_no', None)
+			if cust and row.get(reading_field) is not None:
+				readings[cust] = row.get(reading_field)
 
 		try:
-			# Update the customer's custom meter reading
-			frappe.db.set_value('Customer', cust, 'custom_meter_reading', cur, update_modified=False)
+			set_values_by_name("Customer", "custom_meter_reading", readings)
 		except Exception as e:
-			frappe.log_error(message=f"Failed updating custom_meter_reading for {cust}: {e}", title="MeterMovement.update_customer_meter_reading")
+			frappe.log_error(message=f"Failed setting custom_meter_reading from {reading_field}: {e}", title="MeterMovement.set_customer_meter_readings")
+
+	def get_sales_invoice_defaults(self):
+		"""Company, currency and customer price lists for this movement's invoices, loaded once"""
+		if not getattr(self, '_sales_invoice_defaults', None):
+			# Get default company
+			company = frappe.defaults.get_user_default("Company") or frappe.db.get_single_value("Global Defaults", "default_company")
+			if not company:
+				frappe.throw(_("Please set default company"))
 
-	def create_sales_invoice_for_customer(self, row):
-		"""Create a Sales Invoice for a customer based on meter reading"""
+			customers = list({row.customer_name for row in self.customer_table if row.customer_name})
+			self._sales_invoice_defaults = frappe._dict(
+				company=company,
+				currency=frappe.db.get_value("Company", company, "default_currency"),
+				price_lists=dict(
+					frappe.get_all(
+						"Customer",
+						filters={"name": ["in", customers]},
+						fields=["name", "default_price_list"],
+						as_list=True,
+					)
+				) if customers else {},
+			)
+		return self._sales_invoice_defaults
+
+	def create_sales_invoice_for_customer(self, row, submit=True, link=True):
+		"""Create a Sales Invoice for a customer based on meter reading.
+
+		With `submit=False` the invoice is only inserted (and so validated) as a draft,
+		to be submitted later by the batched submission stage. With `link=False` the
+		row's link is only set in memory, for `link_sales_invoices` to write for all rows.
+		"""
 		try:
 			# Get customer name
 			customer = getattr(row, 'customer_name', None) or getattr(row, 'customer_no', None)
@@ -137,19 +213,16 @@ class MeterMovement(Document):
 				frappe.log_error(message=f"No customer found in row {row.idx}", title="MeterMovement.create_sales_invoice_for_customer")
 				return
 
-			# Get default company
-			company = frappe.defaults.get_user_default("Company") or frappe.db.get_single_value("Global Defaults", "default_company")
-			if not company:
-				frappe.throw(_("Please set default company"))
+			defaults = self.get_sales_invoice_defaults()
 
 			# Create Sales Invoice
 			sales_invoice = frappe.new_doc("Sales Invoice")
 			sales_invoice.customer = customer
 			sales_invoice.posting_date = self.posting_date or frappe.utils.today()
-			sales_invoice.company = company
+			sales_invoice.company = defaults.company
 			sales_invoice.custom_reference_number = self.name1
-			sales_invoice.currency = frappe.db.get_value("Company", company, "default_currency")
-			sales_invoice.selling_price_list = frappe.db.get_value("Customer", customer, "default_price_list") or "Standard Selling"
+			sales_invoice.currency = defaults.currency
+			sales_invoice.selling_price_list = defaults.price_lists.get(customer) or "Standard Selling"
 			
 			# Set reference to Meter Movement
 			sales_invoice.custom_meter_movement = self.name
@@ -167,39 +240,58 @@ class MeterMovement(Document):
 
 			# Save and submit the Sales Invoice
 			sales_invoice.insert()
-			sales_invoice.submit()
+			if submit:
+				sales_invoice.submit()
 
 			# Update the row with Sales Invoice reference (only if field exists)
-			try:
-				frappe.db.set_value("Meter Movement Table", row.name, "custom_sales_invoice", sales_invoice.name)
-			except Exception as field_error:
-				# Log the field error but don't fail the entire process
-				frappe.log_error(message=f"Could not update custom_sales_invoice field: {field_error}", title="MeterMovement.create_sales_invoice_for_customer")
+			row.custom_sales_invoice = sales_invoice.name
+			if link:
+				try:
+					frappe.db.set_value("Meter Movement Table", row.name, "custom_sales_invoice", sales_invoice.name)
+				except Exception as field_error:
+					# Log the field error but don't fail the entire process
+					frappe.log_error(message=f"Could not update custom_sales_invoice field: {field_error}", title="MeterMovement.create_sales_invoice_for_customer")
 
-			frappe.msgprint(_("Sales Invoice {0} created for customer {1}").format(sales_invoice.name, customer))
+			return sales_invoice.name
 
 		except Exception as e:
 			frappe.log_error(message=f"Failed creating Sales Invoice for customer {customer}: {e}", title="MeterMovement.create_sales_invoice_for_customer")
 			frappe.throw(_("Failed to create Sales Invoice for customer {0}: {1}").format(customer, str(e)))
 
+	def link_sales_invoices(self):
+		"""Write the Sales Invoice links set on the rows in memory, in one statement"""
+		try:
+			set_values_by_name(
+				"Meter Movement Table",
+				"custom_sales_invoice",
+				{row.name: row.custom_sales_invoice for row in self.customer_table if row.get("custom_sales_invoice")},
+			)
+		except Exception as field_error:
+			frappe.log_error(message=f"Could not update custom_sales_invoice field: {field_error}", title="MeterMovement.link_sales_invoices")
+
 	def cancel_related_sales_invoices(self):
 		"""Cancel all Sales Invoices related to this Meter Movement"""
 		if not getattr(self, 'customer_table', None):
 			return
 
-		for row in self.customer_table:
-			# Get the related Sales Invoice
-			sales_invoice_name = row.get("custom_sales_invoice")
-			
-			if sales_invoice_name:
-				try:
-					# Check status before cancelling
-					if frappe.db.get_value("Sales Invoice", sales_invoice_name, "docstatus") == 1:
-						sales_invoice = frappe.get_doc("Sales Invoice", sales_invoice_name)
-						sales_invoice.cancel()
-						frappe.msgprint(_("Sales Invoice {0} cancelled").format(sales_invoice_name))
-				except Exception as e:
-					frappe.log_error(message=f"Failed cancelling Sales Invoice {sales_invoice_name}: {e}", title="MeterMovement.cancel_related_sales_invoices")
+		sales_invoice_names = [row.custom_sales_invoice for row in self.customer_table if row.get("custom_sales_invoice")]
+		# Check status before cancelling
+		docstatuses = get_sales_invoice_docstatuses(sales_invoice_names)
+
+		cancelled_count = 0
+		for sales_invoice_name in sales_invoice_names:
+			if docstatuses.get(sales_invoice_name) != 1:
+				continue
+
+			try:
+				sales_invoice = frappe.get_doc("Sales Invoice", sales_invoice_name)
+				sales_invoice.cancel()
+				cancelled_count += 1
+			except Exception as e:
+				frappe.log_error(message=f"Failed cancelling Sales Invoice {sales_invoice_name}: {e}", title="MeterMovement.cancel_related_sales_invoices")
+
+		if cancelled_count:
+			frappe.msgprint(_("Cancelled {0} Sales Invoices").format(cancelled_count))
 
 	def update_related_sales_invoices(self):
 		"""Update all Sales Invoices related to this Meter Movement"""
@@ -207,35 +299,40 @@ class MeterMovement(Document):
 			if not getattr(self, 'customer_table', None):
 				return
 
+			# Get the related Sales Invoices as saved, with their status
+			links = dict(
+				frappe.get_all(
+					"Meter Movement Table",
+					filters={"parent": self.name, "custom_sales_invoice": ["is", "set"]},
+					fields=["name", "custom_sales_invoice"],
+					as_list=True,
+				)
+			)
+			docstatuses = get_sales_invoice_docstatuses(list(links.values()))
+
 			for row in self.customer_table:
-				# Get the related Sales Invoice (only if field exists)
-				sales_invoice_name = None
-				try:
-					sales_invoice_name = frappe.db.get_value("Meter Movement Table", row.name, "custom_sales_invoice")
-				except Exception:
-					# Field doesn't exist yet, skip this row
-					continue
-					
+				sales_invoice_name = links.get(row.name)
 				if not sales_invoice_name:
 					continue
 
+				# Only update if the Sales Invoice is in draft state
+				if docstatuses.get(sales_invoice_name) != 0:
+					frappe.msgprint(_("Cannot update submitted Sales Invoice {0}").format(sales_invoice_name))
+					continue
+
 				try:
 					sales_invoice = frappe.get_doc("Sales Invoice", sales_invoice_name)
-					
-					# Only update if the Sales Invoice is in draft state
-					if sales_invoice.docstatus == 0:
-						# Update the item details
-						if sales_invoice.items:
-							item_row = sales_invoice.items[0]
-							item_row.qty = row.difference or 0
-							item_row.rate = row.price or 0
-							item_row.amount = row.total or 0
-							item_row.description = _("Electricity consumption for meter: {0}").format(row.meter_number or "")
-
-						sales_invoice.save()
-						frappe.msgprint(_("Sales Invoice {0} updated").format(sales_invoice_name))
-					else:
-						frappe.msgprint(_("Cannot update submitted Sales Invoice {0}").format(sales_invoice_name))
+
+					# Update the item details
+					if sales_invoice.items:
+						item_row = sales_invoice.items[0]
+						item_row.qty = row.difference or 0
+						item_row.rate = row.price or 0
+						item_row.amount = row.total or 0
+						item_row.description = _("Electricity consumption for meter: {0}").format(row.meter_number or "")
+
+					sales_invoice.save()
+					frappe.msgprint(_("Sales Invoice {0} updated").format(sales_invoice_name))
 
 				except Exception as e:
 					frappe.log_error(message=f"Failed updating Sales Invoice {sales_invoice_name}: {e}", title="MeterMovement.update_related_sales_invoices")
@@ -244,12 +341,49 @@ class MeterMovement(Document):
 			frappe.log_error(message=f"Failed updating related Sales Invoices: {e}", title="MeterMovement.update_related_sales_invoices")
 
 
+def get_sales_invoice_docstatuses(sales_invoice_names):
+	"""Return {sales_invoice: docstatus} for the given Sales Invoices, in one query"""
+	if not sales_invoice_names:
+		return {}
+
+	return dict(
+		frappe.get_all(
+			"Sales Invoice",
+			filters={"name": ["in", sales_invoice_names]},
+			fields=["name", "docstatus"],
+			as_list=True,
+		)
+	)
+
+
+def set_values_by_name(doctype, fieldname, values):
+	"""Write {name: value} to `fieldname` of `doctype` in one UPDATE, leaving `modified` as is"""
+	if not values:
+		return
+
+	names = list(values)
+	cases = " ".join(["WHEN %s THEN %s"] * len(names))
+	placeholders = ", ".join(["%s"] * len(names))
+	frappe.db.sql(
+		f"""
+		UPDATE `tab{doctype}`
+		SET `{fieldname}` = CASE name {cases} END
+		WHERE name IN ({placeholders})
+		""",
+		[value for name in names for value in (name, values[name])] + names,
+	)
+	# the UPDATE bypasses Document, so drop cached copies (get_cached_doc/get_cached_value)
+	# of the doctype in one call rather than one per name
+	frappe.clear_document_cache(doctype)
+
+
 @frappe.whitelist()
-def get_customers_for_meter_movement(electricity_type=None):
+def get_customers_for_meter_movement(electricity_type=None, limit_page_length=500):
 	"""Return a list of customers to populate the Meter Movement child table.
 
 	Optionally filter customers by `electricity_type` if the parameter is provided.
 	Also fetches item_name and price_per_kilo from the Electricity Type doctype.
+	Pass `limit_page_length=0` to load the whole roster.
 
 	This function returns a list of dicts with keys that map to the child table
 	fields (e.g. customer_no, customer_name, meter_no). Adjust the selected
@@ -292,7 +426,7 @@ def get_customers_for_meter_movement(electricity_type=None):
 		"Customer",
 		fields=fields,
 		filters=filters,
-		limit_page_length=500,
+		limit_page_length=cint(limit_page_length),
 	)
 
 	# Fetch electricity type data if provided
@@ -309,7 +443,8 @@ def get_customers_for_meter_movement(electricity_type=None):
 
 	# Ensure returned customers have both keys (empty string if not present)
 	# and add electricity type data to each customer
-	customer_names = [c["customer_name"] for c in customers if c.get("customer_name")]
+	# GL Entries reference the Customer by its ID, not its display name
+	customer_names = [c["customer_no"] for c in customers]
 	
 	# Fetch balances
 	customer_balances = {}
@@ -349,52 +484,44 @@ def get_customers_for_meter_movement(electricity_type=None):
 		c["item_name"] = electricity_type_data.get("item_name", "")
 		c["price_per_kilo"] = electricity_type_data.get("price_per_kilo", 0)
 		# Add balance
-		c["balance"] = customer_balances.get(c["customer_name"], 0.0)
+		c["balance"] = customer_balances.get(c["customer_no"], 0.0)
 
 	return customers
 
 
 @frappe.whitelist()
 def create_sales_invoices_for_meter_movement(meter_movement_name):
-	"""Create Sales Invoices for all customers in a Meter Movement (if not already created)"""
-	try:
-		meter_movement = frappe.get_doc("Meter Movement", meter_movement_name)
-		
-		if meter_movement.docstatus != 1:
-			frappe.throw(_("Meter Movement must be submitted to create Sales Invoices"))
+	"""Queue a job creating Sales Invoices for all customers in a Meter Movement (if not already created).
 
-		created_count = 0
-		for row in meter_movement.customer_table:
-			# Check if Sales Invoice already exists (only if field exists)
-			has_sales_invoice = False
-			try:
-				has_sales_invoice = bool(row.custom_sales_invoice)
-			except AttributeError:
-				# Field doesn't exist yet, assume no Sales Invoice exists
-				pass
-				
-			if not has_sales_invoice:
-				meter_movement.create_sales_invoice_for_customer(row)
-				created_count += 1
-
-		if created_count > 0:
-			frappe.msgprint(_("Created {0} Sales Invoices").format(created_count))
-		else:
-			frappe.msgprint(_("All Sales Invoices already exist"))
+	Returns the `Meter Movement Job` name; per-row results are recorded on the job.
+	"""
+	from electricity_meter_management.electricity_meter_management.services.jobs import (
+		CREATE_SALES_INVOICES,
+		enqueue_meter_movement_job,
+	)
+
+	meter_movement = frappe.get_doc("Meter Movement", meter_movement_name)
+	meter_movement.check_permission("submit")
 
-	except Exception as e:
-		frappe.log_error(message=f"Failed creating bulk Sales Invoices: {e}", title="create_sales_invoices_for_meter_movement")
-		frappe.throw(_("Failed to create Sales Invoices: {0}").format(str(e)))
+	if meter_movement.docstatus != 1:
+		frappe.throw(_("Meter Movement must be submitted to create Sales Invoices"))
+	if meter_movement.defer_invoice_submit:
+		frappe.throw(_("Sales Invoices of a Meter Movement with deferred submission are created by Submit Draft Invoices"))
+
+	return enqueue_meter_movement_job(meter_movement_name, CREATE_SALES_INVOICES)
 
 
 @frappe.whitelist()
 def cancel_sales_invoices_for_meter_movement(meter_movement_name):
-	"""Cancel all Sales Invoices for a Meter Movement"""
-	try:
-		meter_movement = frappe.get_doc("Meter Movement", meter_movement_name)
-		meter_movement.cancel_related_sales_invoices()
-		frappe.msgprint(_("Sales Invoices cancelled successfully"))
-
-	except Exception as e:
-		frappe.log_error(message=f"Failed cancelling Sales Invoices: {e}", title="cancel_sales_invoices_for_meter_movement")
-		frappe.throw(_("Failed to cancel Sales Invoices: {0}").format(str(e)))
+	"""Queue a job cancelling all Sales Invoices for a Meter Movement.
+
+	Returns the `Meter Movement Job` name; per-row results are recorded on the job.
+	"""
+	from electricity_meter_management.electricity_meter_management.services.jobs import (
+		CANCEL_SALES_INVOICES,
+		enqueue_meter_movement_job,
+	)
+
+	frappe.get_doc("Meter Movement", meter_movement_name).check_permission("cancel")
+
+	return enqueue_meter_movement_job(meter_movement_name, CANCEL_SALES_INVOICES)
@@ -1,9 +1,56 @@
 # Copyright (c) 2025, alipro and Contributors
 # See license.txt
 
-# import frappe
+import frappe
 from frappe.tests.utils import FrappeTestCase
 
+from electricity_meter_management.electricity_meter_management.doctype.meter_movement.meter_movement import (
+	get_sales_invoice_docstatuses,
+	set_values_by_name,
+)
+
+test_dependencies = ["Item", "Customer"]
+
+
+def make_electricity_type(name, price_per_kilo):
+	if not frappe.db.exists("Electricity Type", name):
+		frappe.get_doc(
+			{
+				"doctype": "Electricity Type",
+				"name1": name,
+				"item_name": "_Test Item",
+				"price_per_kilo": price_per_kilo,
+			}
+		).insert()
+	return name
+
 
 class TestMeterMovement(FrappeTestCase):
-	pass
+	def test_set_values_by_name(self):
+		first = make_electricity_type("_Test Bulk Type 1", 1)
+		second = make_electricity_type("_Test Bulk Type 2", 2)
+
+		set_values_by_name("Electricity Type", "price_per_kilo", {first: 5, second: 7})
+
+		self.assertEqual(frappe.db.get_value("Electricity Type", first, "price_per_kilo"), 5)
+		self.assertEqual(frappe.db.get_value("Electricity Type", second, "price_per_kilo"), 7)
+		self.assertEqual(frappe.db.get_value("Electricity Type", first, "item_name"), "_Test Item")
+
+	def test_sales_invoice_docstatuses(self):
+		self.assertEqual(get_sales_invoice_docstatuses([]), {})
+		self.assertEqual(get_sales_invoice_docstatuses(["_Test Missing Sales Invoice"]), {})
+
+	def test_sales_invoice_defaults_are_loaded_once(self):
+		meter_movement = frappe.new_doc("Meter Movement")
+		meter_movement.append("customer_table", {"customer_name": "_Test Customer"})
+
+		defaults = meter_movement.get_sales_invoice_defaults()
+
+		self.assertIs(meter_movement.get_sales_invoice_defaults(), defaults)
+		self.assertEqual(
+			defaults.currency, frappe.db.get_value("Company", defaults.company, "default_currency")
+		)
+		self.assertEqual(
+			defaults.price_lists.get("_Test Customer"),
+			frappe.db.get_value("Customer", "_Test Customer", "default_price_list"),
+		)
@@ -0,0 +1,16 @@
+# Copyright (c) 2026, alipro and contributors
+# For license information, please see license.txt
+
+from frappe.model.document import Document
+
+
+class MeterReadingLog(Document):
+	pass
+
+
+def on_doctype_update():
+	from electricity_meter_management.electricity_meter_management.services.indexes import (
+		add_doctype_indexes,
+	)
+
+	add_doctype_indexes("Meter Reading Log")
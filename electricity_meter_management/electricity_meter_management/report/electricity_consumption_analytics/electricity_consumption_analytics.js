@@ -0,0 +1,25 @@
+// Copyright (c) 2026, alipro and contributors
+// For license information, please see license.txt
+
+frappe.query_reports["Electricity Consumption Analytics"] = {
+	filters: [
+		{
+			fieldname: "electricity_type",
+			label: __("Electricity Type"),
+			fieldtype: "Link",
+			options: "Electricity Type",
+		},
+		{
+			fieldname: "from_date",
+			label: __("From Date"),
+			fieldtype: "Date",
+			default: frappe.datetime.add_months(frappe.datetime.month_start(), -11),
+		},
+		{
+			fieldname: "to_date",
+			label: __("To Date"),
+			fieldtype: "Date",
+			default: frappe.datetime.month_end(),
+		},
+	],
+};
@@ -0,0 +1,92 @@
+# Copyright (c) 2026, alipro and contributors
+# For license information, please see license.txt
+
+import frappe
+from frappe import _
+
+
+def execute(filters=None):
+	"""Consumption and revenue per Electricity Type and month.
+
+	Reads only `Electricity Consumption Summary`, which is maintained on
+	Meter Movement submit/cancel.
+	"""
+	filters = frappe._dict(filters or {})
+	data = get_data(filters)
+	return get_columns(), data, None, get_chart(data)
+
+
+def get_columns():
+	return [
+		{
+			"fieldname": "electricity_type",
+			"label": _("Electricity Type"),
+			"fieldtype": "Link",
+			"options": "Electricity Type",
+			"width": 180,
+		},
+		{"fieldname": "period", "label": _("Period"), "fieldtype": "Date", "width": 110},
+		{
+			"fieldname": "total_consumption",
+			"label": _("Total Consumption"),
+			"fieldtype": "Float",
+			"width": 150,
+		},
+		{"fieldname": "total_amount", "label": _("Total Amount"), "fieldtype": "Float", "width": 150},
+		{"fieldname": "customer_count", "label": _("Customer Count"), "fieldtype": "Int", "width": 120},
+		{
+			"fieldname": "average_consumption",
+			"label": _("Average Consumption"),
+			"fieldtype": "Float",
+			"width": 150,
+		},
+	]
+
+
+def get_data(filters):
+	conditions = {}
+	if filters.electricity_type:
+		conditions["electricity_type"] = filters.electricity_type
+	if filters.from_date and filters.to_date:
+		conditions["period"] = ["between", [filters.from_date, filters.to_date]]
+	elif filters.from_date:
+		conditions["period"] = [">=", filters.from_date]
+	elif filters.to_date:
+		conditions["period"] = ["<=", filters.to_date]
+
+	return frappe.get_all(
+		"Electricity Consumption Summary",
+		filters=conditions,
+		fields=[
+			"electricity_type",
+			"period",
+			"total_consumption",
+			"total_amount",
+			"customer_count",
+			"average_consumption",
+		],
+		order_by="period asc, electricity_type asc",
+	)
+
+
+def get_chart(data):
+	if not data:
+		return None
+
+	periods = sorted({row.period for row in data})
+	electricity_types = sorted({row.electricity_type for row in data})
+	consumption = {(row.electricity_type, row.period): row.total_consumption for row in data}
+
+	return {
+		"data": {
+			"labels": [frappe.format(period, {"fieldtype": "Date"}) for period in periods],
+			"datasets": [
+				{
+					"name": electricity_type,
+					"values": [consumption.get((electricity_type, period), 0) for period in periods],
+				}
+				for electricity_type in electricity_types
+			],
+		},
+		"type": "bar",
+	}
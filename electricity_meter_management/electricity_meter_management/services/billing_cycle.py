@@ -0,0 +1,142 @@
+# Copyright (c) 2026, alipro and contributors
+# For license information, please see license.txt
+
+"""Scheduled creation of the draft Meter Movement of each billing cycle.
+
+For every Electricity Type with `auto_create_meter_movement` set, the nightly job
+creates the cycle's draft Meter Movement with the full customer roster, previous
+readings, prices and balances already filled in, leaving only current readings to
+be entered.
+
+Previous readings and balances are only final once the previous cycle's movement is
+submitted and its invoices are posted, so the draft is not created before that; the
+job runs nightly and creates it on the first night after.
+"""
+
+import frappe
+from frappe.utils import add_months, flt, get_last_day, getdate, today
+
+CYCLE_MONTHS = {"Monthly": 1, "Bi-Monthly": 2, "Quarterly": 3}
+
+# the period of a Meter Movement, falling back to its posting or creation date when
+# the optional period fields are not set
+PERIOD_START = "COALESCE(from_date, to_date, posting_date, DATE(creation))"
+PERIOD_END = "COALESCE(to_date, from_date, posting_date, DATE(creation))"
+
+
+def get_cycle_dates(billing_cycle, date=None):
+	"""Return (from_date, to_date) of the billing cycle containing `date`"""
+	date = getdate(date or today())
+	months = CYCLE_MONTHS.get(billing_cycle or "Monthly", 1)
+	start_month = (date.month - 1) // months * months + 1
+	from_date = date.replace(month=start_month, day=1)
+	return from_date, get_last_day(add_months(from_date, months - 1))
+
+
+def create_scheduled_meter_movements():
+	"""Scheduler job: create the current cycle's draft Meter Movement where missing"""
+	electricity_types = frappe.get_all(
+		"Electricity Type",
+		filters={"auto_create_meter_movement": 1},
+		fields=["name", "billing_cycle"],
+	)
+	for electricity_type in electricity_types:
+		from_date, to_date = get_cycle_dates(electricity_type.billing_cycle)
+		try:
+			create_meter_movement_for_cycle(electricity_type.name, from_date, to_date)
+			frappe.db.commit()
+		except Exception as e:
+			frappe.db.rollback()
+			frappe.log_error(
+				message=f"Failed creating Meter Movement for {electricity_type.name}: {e}",
+				title="create_scheduled_meter_movements",
+			)
+
+
+def create_meter_movement_for_cycle(electricity_type, from_date, to_date):
+	"""Create the draft Meter Movement of one cycle, unless it already exists or an
+	earlier movement of the type is not billed yet.
+
+	Returns the name of the new Meter Movement, or None.
+	"""
+	from electricity_meter_management.electricity_meter_management.doctype.meter_movement.meter_movement import (
+		get_customers_for_meter_movement,
+	)
+
+	if get_overlapping_meter_movement(electricity_type, from_date, to_date):
+		return None
+
+	if get_unbilled_meter_movement(electricity_type, from_date):
+		return None
+
+	roster = get_customers_for_meter_movement(electricity_type, limit_page_length=0)
+	if not roster:
+		return None
+
+	meter_movement = frappe.new_doc("Meter Movement")
+	meter_movement.name1 = f"{electricity_type} {from_date} - {to_date}"
+	meter_movement.electricity_type = electricity_type
+	meter_movement.from_date = from_date
+	meter_movement.to_date = to_date
+
+	for customer in roster:
+		balance = flt(customer.balance)
+		meter_movement.append(
+			"customer_table",
+			{
+				"customer_name": customer.customer_no,
+				"meter_number": customer.meter_number or None,
+				"previous_reading": customer.previous_reading or 0,
+				"item_name": customer.item_name,
+				"price": customer.price_per_kilo,
+				"balance": balance,
+				"difference": 0,
+				"total": 0,
+				"total_all": balance,
+			},
+		)
+
+	meter_movement.insert(ignore_permissions=True)
+	return meter_movement.name
+
+
+def get_overlapping_meter_movement(electricity_type, from_date, to_date):
+	"""Return a draft or submitted Meter Movement of the type whose period overlaps the cycle.
+
+	Catches movements created by hand for the same period with different boundaries,
+	or with no period at all.
+	"""
+	result = frappe.db.sql(
+		f"""
+		SELECT name
+		FROM `tabMeter Movement`
+		WHERE electricity_type = %(electricity_type)s
+		  AND docstatus < 2
+		  AND {PERIOD_START} <= %(to_date)s
+		  AND {PERIOD_END} >= %(from_date)s
+		LIMIT 1
+		""",
+		{"electricity_type": electricity_type, "from_date": from_date, "to_date": to_date},
+	)
+	return result[0][0] if result else None
+
+
+def get_unbilled_meter_movement(electricity_type, before_date):
+	"""Return a Meter Movement of the type for a period before `before_date` that is
+	still a draft, or whose deferred invoices are not all submitted yet.
+	"""
+	result = frappe.db.sql(
+		f"""
+		SELECT name
+		FROM `tabMeter Movement`
+		WHERE electricity_type = %(electricity_type)s
+		  AND {PERIOD_END} < %(before_date)s
+		  AND (
+			docstatus = 0
+			OR (docstatus = 1 AND defer_invoice_submit = 1 AND IFNULL(invoice_submission_status, '') != 'Completed')
+		  )
+		LIMIT 1
+		""",
+		{"electricity_type": electricity_type, "before_date": before_date},
+	)
+	return result[0][0] if result else None
@@ -0,0 +1,121 @@
+# Copyright (c) 2026, alipro and contributors
+# For license information, please see license.txt
+
+"""Incrementally maintained consumption analytics per Electricity Type and month.
+
+Each submitted Meter Movement adds its rows to the `Electricity Consumption Summary`
+record of its (electricity_type, period) and each cancellation subtracts them again,
+so reports read one small table instead of aggregating `Meter Movement Table`.
+"""
+
+import frappe
+from frappe.utils import cint, flt, get_first_day, get_last_day, getdate
+
+SUMMARY_DOCTYPE = "Electricity Consumption Summary"
+
+
+def get_summary_period(meter_movement):
+	"""Return the first day of the month a Meter Movement is reported under.
+
+	Uses the same date the Sales Invoices are posted on, falling back to the end
+	of the billing period and finally the creation date so that submit and cancel
+	always resolve to the same period.
+	"""
+	date = meter_movement.posting_date or meter_movement.to_date or meter_movement.creation
+	return get_first_day(getdate(date))
+
+
+def get_movement_totals(meter_movement):
+	"""Aggregate the child rows of a Meter Movement in memory"""
+	total_consumption = 0.0
+	total_amount = 0.0
+
+	for row in meter_movement.get("customer_table") or []:
+		total_consumption += flt(row.difference)
+		total_amount += flt(row.total)
+
+	return {"total_consumption": total_consumption, "total_amount": total_amount}
+
+
+def get_period_customer_count(electricity_type, period):
+	"""Distinct customers billed by the submitted Meter Movements of a period"""
+	return frappe.db.sql(
+		"""
+		SELECT COUNT(DISTINCT mmt.customer_name)
+		FROM `tabMeter Movement Table` mmt
+		INNER JOIN `tabMeter Movement` mm ON mm.name = mmt.parent
+		WHERE mm.docstatus = 1
+		  AND mm.electricity_type = %(electricity_type)s
+		  AND COALESCE(mm.posting_date, mm.to_date, DATE(mm.creation)) BETWEEN %(from_date)s AND %(to_date)s
+		""",
+		{"electricity_type": electricity_type, "from_date": period, "to_date": get_last_day(period)},
+	)[0][0]
+
+
+def apply_meter_movement(meter_movement, sign=1):
+	"""Add (`sign=1`) or remove (`sign=-1`) a Meter Movement from its summary record.
+
+	Consumption and amounts are applied incrementally; `customer_count` is recounted
+	as the distinct customers of the period, so a customer billed by two movements of
+	the same month is counted once. Must run after the movement's docstatus is saved.
+	"""
+	if not meter_movement.electricity_type:
+		return
+
+	totals = get_movement_totals(meter_movement)
+	period = get_summary_period(meter_movement)
+	summary = get_or_create_summary(meter_movement.electricity_type, period)
+
+	total_consumption = flt(summary.total_consumption) + sign * totals["total_consumption"]
+	total_amount = flt(summary.total_amount) + sign * totals["total_amount"]
+	customer_count = cint(get_period_customer_count(meter_movement.electricity_type, period))
+	movement_count = max(cint(summary.movement_count) + sign, 0)
+
+	frappe.db.set_value(
+		SUMMARY_DOCTYPE,
+		summary.name,
+		{
+			"total_consumption": total_consumption,
+			"total_amount": total_amount,
+			"customer_count": customer_count,
+			"movement_count": movement_count,
+			"average_consumption": total_consumption / customer_count if customer_count else 0,
+		},
+		update_modified=False,
+	)
+
+
+def get_or_create_summary(electricity_type, period):
+	"""Return the locked summary row for (electricity_type, period), creating it if missing"""
+	filters = {"electricity_type": electricity_type, "period": period}
+	fields = ["name", "total_consumption", "total_amount", "movement_count"]
+
+	summary = frappe.db.get_value(SUMMARY_DOCTYPE, filters, fields, as_dict=True, for_update=True)
+	if summary:
+		return summary
+
+	frappe.db.savepoint("create_consumption_summary")
+	try:
+		frappe.get_doc({"doctype": SUMMARY_DOCTYPE, **filters}).insert(ignore_permissions=True)
+	except frappe.DuplicateEntryError:
+		# a concurrent submit of the same type and month created it first; update theirs
+		frappe.db.rollback(save_point="create_consumption_summary")
+
+	return frappe.db.get_value(SUMMARY_DOCTYPE, filters, fields, as_dict=True, for_update=True)
+
+
+def rebuild_consumption_summary(electricity_type=None):
+	"""Recompute summary records from submitted Meter Movements.
+
+	Used to backfill the table after install and to repair drift; normal operation
+	only goes through `apply_meter_movement`.
+	"""
+	filters = {"electricity_type": electricity_type} if electricity_type else {}
+	frappe.db.delete(SUMMARY_DOCTYPE, filters)
+
+	movement_filters = {"docstatus": 1}
+	if electricity_type:
+		movement_filters["electricity_type"] = electricity_type
+
+	for name in frappe.get_all("Meter Movement", filters=movement_filters, pluck="name"):
+		apply_meter_movement(frappe.get_doc("Meter Movement", name))
@@ -0,0 +1,32 @@
+# Copyright (c) 2026, alipro and contributors
+# For license information, please see license.txt
+
+import frappe
+from frappe import _
+from frappe.utils import cint
+
+
+def validate_unique_meter_number(doc, method=None):
+	"""Allow a meter number on at most one active (not disabled) Customer"""
+	if cint(doc.disabled):
+		return
+
+	validate_meter_number_is_free(doc.get("custom_meter_number"), doc.name)
+
+
+def validate_meter_number_is_free(meter_number, customer):
+	"""Throw if an active Customer other than `customer` already has `meter_number`"""
+	meter_number = cint(meter_number)
+	if not meter_number:
+		return
+
+	duplicate = frappe.db.get_value(
+		"Customer",
+		{"custom_meter_number": meter_number, "disabled": 0, "name": ["!=", customer]},
+		"name",
+	)
+	if duplicate:
+		frappe.throw(
+			_("Meter number {0} is already assigned to active customer {1}").format(meter_number, duplicate),
+			frappe.UniqueValidationError,
+		)
@@ -0,0 +1,167 @@
+# Copyright (c) 2026, alipro and contributors
+# For license information, please see license.txt
+
+"""Indexes backing the app's hot lookup paths and a health check for them.
+
+Indexes on core doctypes, including the unique index allowing a meter number on one
+active Customer, are installed by the `add_meter_lookup_indexes` patch and those on the
+app's own doctypes by their `on_doctype_update`; `get_index_health` reports any that are
+missing, meter numbers shared by active customers, and the `EXPLAIN` plan of each lookup
+query.
+"""
+
+import frappe
+
+# (doctype, columns, index name) installed by the `add_meter_lookup_indexes` patch
+APP_INDEXES = [
+	("Customer", ["custom_meter_number", "disabled"], "meter_number_disabled_index"),
+	("Customer", ["custom_electricity_type", "disabled"], "electricity_type_disabled_index"),
+	("Sales Invoice", ["custom_meter_movement"], "custom_meter_movement_index"),
+	("Sales Invoice", ["custom_meter_movement_row"], "custom_meter_movement_row_index"),
+	("Meter Movement Table", ["custom_sales_invoice"], "custom_sales_invoice_index"),
+]
+
+# (doctype, columns, index name) created by the doctype's own `on_doctype_update`
+DOCTYPE_INDEXES = [
+	("Meter Reading Log", ["meter_number", "timestamp"], "meter_number_timestamp_index"),
+	("Meter Reading Log", ["customer", "timestamp"], "customer_timestamp_index"),
+]
+
+# MariaDB has no partial unique indexes: a stored column holding the meter number of active
+# customers only (NULL otherwise) carries the unique index allowing one active customer per meter
+ACTIVE_METER_NUMBER_COLUMN = "active_meter_number"
+ACTIVE_METER_NUMBER_INDEX = "unique_active_meter_number_index"
+
+# name: (query, sample values) for the lookups the app runs on every roster load or invoice link
+APP_QUERIES = {
+	"customer_roster": (
+		"""SELECT name, customer_name, custom_meter_number, custom_meter_reading
+		FROM `tabCustomer`
+		WHERE custom_electricity_type = %s AND disabled = 0""",
+		("",),
+	),
+	"customer_by_meter_number": (
+		"SELECT name FROM `tabCustomer` WHERE custom_meter_number = %s AND disabled = 0",
+		(0,),
+	),
+	"sales_invoice_by_meter_movement": (
+		"SELECT name, docstatus FROM `tabSales Invoice` WHERE custom_meter_movement = %s",
+		("",),
+	),
+	"sales_invoice_by_meter_movement_row": (
+		"SELECT name, docstatus FROM `tabSales Invoice` WHERE custom_meter_movement_row = %s",
+		("",),
+	),
+	"meter_movement_row_by_sales_invoice": (
+		"SELECT name, parent FROM `tabMeter Movement Table` WHERE custom_sales_invoice = %s",
+		("",),
+	),
+	"meter_reading_history": (
+		"SELECT * FROM `tabMeter Reading Log` WHERE meter_number = %s ORDER BY timestamp DESC LIMIT 100",
+		(0,),
+	),
+}
+
+
+def ensure_app_indexes():
+	"""Create any of `APP_INDEXES` that does not exist yet, and the active meter number constraint"""
+	for doctype, columns, index_name in APP_INDEXES:
+		if not frappe.db.table_exists(doctype):
+			continue
+		frappe.db.add_index(doctype, columns, index_name)
+
+	ensure_active_meter_number_constraint()
+
+
+def ensure_active_meter_number_constraint():
+	"""Enforce one active Customer per meter number in the database.
+
+	The unique index is left out while active customers share a meter number;
+	`get_index_health` reports them until they are fixed and this runs again.
+	"""
+	columns = frappe.db.get_table_columns("Customer")
+	if "custom_meter_number" not in columns:
+		return
+
+	if ACTIVE_METER_NUMBER_COLUMN not in columns:
+		frappe.db.sql_ddl(
+			f"""ALTER TABLE `tabCustomer` ADD COLUMN `{ACTIVE_METER_NUMBER_COLUMN}` INT
+			GENERATED ALWAYS AS (IF(disabled = 0 AND custom_meter_number > 0, custom_meter_number, NULL))
+			STORED"""
+		)
+
+	if frappe.db.has_index("tabCustomer", ACTIVE_METER_NUMBER_INDEX) or get_duplicate_meter_numbers():
+		return
+
+	frappe.db.sql_ddl(
+		f"""ALTER TABLE `tabCustomer`
+		ADD UNIQUE INDEX `{ACTIVE_METER_NUMBER_INDEX}` (`{ACTIVE_METER_NUMBER_COLUMN}`)"""
+	)
+
+
+def get_duplicate_meter_numbers():
+	"""Meter numbers assigned to more than one active Customer, with those customers"""
+	return frappe.db.sql(
+		"""
+		SELECT custom_meter_number AS meter_number, GROUP_CONCAT(name ORDER BY name) AS customers
+		FROM `tabCustomer`
+		WHERE disabled = 0 AND custom_meter_number > 0
+		GROUP BY custom_meter_number
+		HAVING COUNT(*) > 1
+		""",
+		as_dict=True,
+	)
+
+
+def add_doctype_indexes(doctype):
+	"""Create the `DOCTYPE_INDEXES` of `doctype`, called from its `on_doctype_update`"""
+	for index_doctype, columns, index_name in DOCTYPE_INDEXES:
+		if index_doctype == doctype:
+			frappe.db.add_index(doctype, columns, index_name)
+
+
+def get_missing_indexes():
+	missing = []
+	for doctype, columns, index_name in APP_INDEXES + DOCTYPE_INDEXES:
+		if not frappe.db.has_index(f"tab{doctype}", index_name):
+			missing.append({"doctype": doctype, "columns": columns, "index_name": index_name})
+	if not frappe.db.has_index("tabCustomer", ACTIVE_METER_NUMBER_INDEX):
+		missing.append(
+			{
+				"doctype": "Customer",
+				"columns": [ACTIVE_METER_NUMBER_COLUMN],
+				"index_name": ACTIVE_METER_NUMBER_INDEX,
+			}
+		)
+	return missing
+
+
+def explain_app_queries():
+	"""Return the `EXPLAIN` plan of each query in `APP_QUERIES`.
+
+	A query is flagged as `full_scan` when any table in its plan is read with
+	access type `ALL`.
+	"""
+	plans = {}
+	for name, (query, values) in APP_QUERIES.items():
+		plan = frappe.db.sql(f"EXPLAIN {query}", values, as_dict=True)
+		plans[name] = {
+			"full_scan": any((step.get("type") or "").upper() == "ALL" for step in plan),
+			"plan": plan,
+		}
+	return plans
+
+
+@frappe.whitelist()
+def get_index_health():
+	"""Report missing app indexes, meter numbers shared by active customers and the query plans
+	of the app's lookups"""
+	frappe.only_for("System Manager")
+
+	plans = explain_app_queries()
+	return {
+		"missing_indexes": get_missing_indexes(),
+		"duplicate_meter_numbers": get_duplicate_meter_numbers(),
+		"full_scans": [name for name, result in plans.items() if result["full_scan"]],
+		"plans": plans,
+	}
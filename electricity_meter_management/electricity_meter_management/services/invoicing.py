@@ -0,0 +1,189 @@
+# Copyright (c) 2026, alipro and contributors
+# For license information, please see license.txt
+
+"""Two-phase invoicing for Meter Movements.
+
+When `defer_invoice_submit` is set, submitting a Meter Movement only creates and
+validates one draft Sales Invoice per row. The drafts are submitted (and posted to
+the GL) later in batches, either on demand or by the nightly scheduler job, so a
+bad row never aborts the run and Meter Movement submit time stays predictable.
+
+Rows whose draft could not be created leave the movement "Partly Failed"; the
+submission stage creates their drafts again before submitting.
+"""
+
+import frappe
+from frappe import _
+
+SUBMIT_BATCH_SIZE = 100
+
+
+def create_draft_sales_invoices(meter_movement):
+	"""Create the draft Sales Invoices of a Meter Movement on submit and report the result"""
+	created, failed = create_missing_draft_sales_invoices(meter_movement)
+	meter_movement.db_set("invoice_submission_status", "Partly Failed" if failed else "Pending")
+
+	frappe.msgprint(_("Created {0} draft Sales Invoices").format(created))
+	if failed:
+		frappe.msgprint(
+			_("Could not create draft Sales Invoices for: {0}").format(
+				", ".join(row["customer"] or str(row["row_idx"]) for row in failed)
+			),
+			indicator="orange",
+		)
+
+
+def create_missing_draft_sales_invoices(meter_movement):
+	"""Create a draft Sales Invoice for every row without one, isolating failures per row.
+
+	Returns the number of drafts created and the failed rows.
+	"""
+	from electricity_meter_management.electricity_meter_management.services.jobs import is_job_timeout
+
+	created, failed = 0, []
+
+	for row in meter_movement.customer_table:
+		if row.get("custom_sales_invoice"):
+			continue
+
+		frappe.db.savepoint("meter_movement_draft_invoice")
+		try:
+			meter_movement.create_sales_invoice_for_customer(row, submit=False, link=False)
+			created += 1
+		except Exception as e:
+			if is_job_timeout(e):
+				raise
+			frappe.db.rollback(save_point="meter_movement_draft_invoice")
+			failed.append({"row_idx": row.idx, "customer": row.customer_name, "error": str(e)})
+			# drop the row's frappe.throw message from message_log; the failed rows are
+			# reported together below
+			frappe.clear_last_message()
+			# the rollback also discarded the Error Log written by create_sales_invoice_for_customer
+			frappe.log_error(
+				message=f"Failed creating draft Sales Invoice for row {row.idx} of {meter_movement.name}: {e}",
+				title="create_draft_sales_invoices",
+			)
+
+	meter_movement.link_sales_invoices()
+	return created, failed
+
+
+def submit_draft_sales_invoices(meter_movement_name, batch_size=SUBMIT_BATCH_SIZE):
+	"""Submit the draft Sales Invoices of a Meter Movement in committed batches, after
+	creating the drafts that failed on submit.
+
+	Returns a progress report with the submitted invoices, and the failed invoices and
+	rows.
+	"""
+	from electricity_meter_management.electricity_meter_management.services.jobs import is_job_timeout
+
+	frappe.db.set_value("Meter Movement", meter_movement_name, "invoice_submission_status", "In Progress")
+	frappe.db.commit()
+
+	drafts, submitted = [], 0
+	# stays Pending if the run is interrupted (e.g. job timeout), so it is picked up again
+	status = "Pending"
+	try:
+		meter_movement = frappe.get_doc("Meter Movement", meter_movement_name)
+		_created, failed = create_missing_draft_sales_invoices(meter_movement)
+		frappe.db.commit()
+
+		drafts = frappe.get_all(
+			"Sales Invoice",
+			filters={"custom_meter_movement": meter_movement_name, "docstatus": 0},
+			pluck="name",
+			order_by="name asc",
+		)
+		for count, sales_invoice_name in enumerate(drafts, start=1):
+			frappe.db.savepoint("submit_draft_sales_invoice")
+			try:
+				frappe.get_doc("Sales Invoice", sales_invoice_name).submit()
+				submitted += 1
+			except Exception as e:
+				if is_job_timeout(e):
+					raise
+				frappe.db.rollback(save_point="submit_draft_sales_invoice")
+				failed.append({"sales_invoice": sales_invoice_name, "error": str(e)})
+				frappe.log_error(
+					message=f"Failed submitting draft Sales Invoice {sales_invoice_name}: {e}",
+					title="submit_draft_sales_invoices",
+				)
+
+			if count % batch_size == 0 or count == len(drafts):
+				frappe.db.commit()
+				frappe.publish_progress(
+					count * 100 / len(drafts),
+					title=_("Submitting Sales Invoices"),
+					doctype="Meter Movement",
+					docname=meter_movement_name,
+					description=_("{0} of {1} Sales Invoices processed").format(count, len(drafts)),
+				)
+
+		status = "Partly Failed" if failed else "Completed"
+	finally:
+		if status == "Pending":
+			# drop the uncommitted batch; its drafts are submitted by the next run
+			frappe.db.rollback()
+		frappe.db.set_value("Meter Movement", meter_movement_name, "invoice_submission_status", status)
+		frappe.db.commit()
+
+	return {"total": len(drafts), "submitted": submitted, "failed": failed, "status": status}
+
+
+def enqueue_submission_job(meter_movement_name):
+	"""Queue the submission of a Meter Movement's drafts, unless its job is already queued or running"""
+	frappe.enqueue(
+		submit_draft_sales_invoices,
+		queue="long",
+		timeout=3600,
+		job_id=f"submit-drafts-{meter_movement_name}",
+		deduplicate=True,
+		meter_movement_name=meter_movement_name,
+	)
+
+
+def submit_pending_draft_invoices():
+	"""Scheduler job: queue one submission job per Meter Movement still waiting for submission.
+
+	"In Progress" movements are included: while their job runs the enqueue is
+	deduplicated, and if the job died without resetting the status it is retried.
+	"""
+	pending = frappe.get_all(
+		"Meter Movement",
+		filters={
+			"docstatus": 1,
+			"invoice_submission_status": ["in", ["Pending", "Partly Failed", "In Progress"]],
+		},
+		pluck="name",
+	)
+	for meter_movement_name in pending:
+		enqueue_submission_job(meter_movement_name)
+
+
+@frappe.whitelist()
+def enqueue_draft_invoice_submission(meter_movement_name):
+	"""Queue the batched submission of a Meter Movement's draft Sales Invoices"""
+	frappe.has_permission("Meter Movement", "submit", meter_movement_name, throw=True)
+
+	enqueue_submission_job(meter_movement_name)
+	frappe.msgprint(_("Sales Invoice submission has been queued"), alert=True)
+
+
+@frappe.whitelist()
+def get_invoice_submission_progress(meter_movement_name):
+	"""Return the number of draft, submitted and cancelled Sales Invoices of a Meter Movement"""
+	frappe.has_permission("Meter Movement", "read", meter_movement_name, throw=True)
+
+	counts = frappe.get_all(
+		"Sales Invoice",
+		filters={"custom_meter_movement": meter_movement_name},
+		fields=["docstatus", "count(name) as count"],
+		group_by="docstatus",
+	)
+	by_docstatus = {row.docstatus: row.count for row in counts}
+	return {
+		"status": frappe.db.get_value("Meter Movement", meter_movement_name, "invoice_submission_status"),
+		"draft": by_docstatus.get(0, 0),
+		"submitted": by_docstatus.get(1, 0),
+		"cancelled": by_docstatus.get(2, 0),
+	}
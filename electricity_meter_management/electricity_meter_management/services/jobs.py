@@ -0,0 +1,230 @@
+# Copyright (c) 2026, alipro and contributors
+# For license information, please see license.txt
+
+"""Background jobs for the bulk Sales Invoice endpoints of a Meter Movement.
+
+Each run is recorded as a `Meter Movement Job` with one result row per movement row
+(created, cancelled, skipped or failed, with the reason). Progress is published over
+realtime to the Meter Movement form, which shows the summarized result table when
+the job finishes, instead of one message per row.
+"""
+
+import frappe
+from frappe import _
+from frappe.utils import now_datetime
+
+JOB_DOCTYPE = "Meter Movement Job"
+PROGRESS_EVENT = "meter_movement_job_progress"
+PROGRESS_INTERVAL = 50
+JOB_TIMEOUT = 3600
+
+CREATE_SALES_INVOICES = "Create Sales Invoices"
+CANCEL_SALES_INVOICES = "Cancel Sales Invoices"
+
+
+def is_job_timeout(exception):
+	"""Whether `exception` is the background job's timeout, which must end the job, not one row"""
+	from rq.timeouts import JobTimeoutException
+
+	return isinstance(exception, JobTimeoutException)
+
+
+def get_background_job_id(meter_movement_name, action):
+	return f"meter-movement-job-{meter_movement_name}-{frappe.scrub(action)}"
+
+
+def get_active_job(meter_movement_name, action):
+	"""Return the Queued or Running job record of a movement and action"""
+	return frappe.db.get_value(
+		JOB_DOCTYPE,
+		{"meter_movement": meter_movement_name, "action": action, "status": ["in", ["Queued", "Running"]]},
+		"name",
+		for_update=True,
+	)
+
+
+def enqueue_meter_movement_job(meter_movement_name, action):
+	"""Record a queued job for `action` and run it in the background; returns the job name.
+
+	While the background job of the same movement and action is queued or running, its
+	record is returned instead of starting a second one.
+	"""
+	from frappe.utils.background_jobs import is_job_enqueued
+
+	job_id = get_background_job_id(meter_movement_name, action)
+	active_job = get_active_job(meter_movement_name, action)
+	if is_job_enqueued(job_id):
+		if not active_job:
+			frappe.throw(
+				_("A {0} job is already running for Meter Movement {1}").format(
+					_(action), meter_movement_name
+				)
+			)
+		return active_job
+
+	if active_job:
+		# its background job ended without finishing the record, e.g. the worker was killed
+		frappe.db.set_value(
+			JOB_DOCTYPE,
+			active_job,
+			{
+				"status": "Failed",
+				"error": _("The background job stopped unexpectedly"),
+				"ended_at": now_datetime(),
+			},
+		)
+
+	job = frappe.get_doc(
+		{
+			"doctype": JOB_DOCTYPE,
+			"meter_movement": meter_movement_name,
+			"action": action,
+			"status": "Queued",
+		}
+	).insert(ignore_permissions=True)
+	# the worker loads the record, so it is committed before the job is queued
+	frappe.db.commit()
+
+	if not frappe.enqueue(
+		run_meter_movement_job,
+		queue="long",
+		timeout=JOB_TIMEOUT,
+		job_id=job_id,
+		deduplicate=True,
+		job_name=job.name,
+	):
+		# another request queued the same job since the check above
+		frappe.delete_doc(JOB_DOCTYPE, job.name, ignore_permissions=True)
+		frappe.db.commit()
+		return get_active_job(meter_movement_name, action)
+
+	return job.name
+
+
+def run_meter_movement_job(job_name):
+	job = frappe.get_doc(JOB_DOCTYPE, job_name)
+	meter_movement = frappe.get_doc("Meter Movement", job.meter_movement)
+	process_row = create_sales_invoice if job.action == CREATE_SALES_INVOICES else cancel_sales_invoice
+
+	job.db_set(
+		{"status": "Running", "started_at": now_datetime(), "total_rows": len(meter_movement.customer_table)}
+	)
+	frappe.db.commit()
+
+	results = []
+	try:
+		for row in meter_movement.customer_table:
+			frappe.db.savepoint("meter_movement_job_row")
+			try:
+				status, sales_invoice, reason = process_row(meter_movement, row)
+			except Exception as e:
+				if is_job_timeout(e):
+					raise
+				frappe.db.rollback(save_point="meter_movement_job_row")
+				status, sales_invoice, reason = "Failed", row.get("custom_sales_invoice"), str(e)
+			# per-row messages are replaced by the job's result table
+			frappe.local.message_log = []
+
+			results.append(
+				{
+					"row_idx": row.idx,
+					"meter_movement_row": row.name,
+					"customer": row.customer_name,
+					"status": status,
+					"sales_invoice": sales_invoice,
+					"reason": reason,
+				}
+			)
+			if len(results) % PROGRESS_INTERVAL == 0:
+				job.db_set("processed_rows", len(results))
+				frappe.db.commit()
+				publish_job_progress(job, len(results))
+	except Exception as e:
+		frappe.db.rollback()
+		job.db_set({"status": "Failed", "error": str(e), "ended_at": now_datetime()})
+		publish_job_progress(job, len(results))
+		raise
+
+	job.reload()
+	job.extend("results", results)
+	job.processed_rows = len(results)
+	job.succeeded_count = sum(1 for result in results if result["status"] in ("Created", "Cancelled"))
+	job.skipped_count = sum(1 for result in results if result["status"] == "Skipped")
+	job.failed_count = sum(1 for result in results if result["status"] == "Failed")
+	job.status = "Completed"
+	job.ended_at = now_datetime()
+	job.save(ignore_permissions=True)
+	frappe.db.commit()
+
+	publish_job_progress(job, len(results))
+
+
+def create_sales_invoice(meter_movement, row):
+	"""Return (status, sales_invoice, reason) after invoicing one row if it has no invoice"""
+	# read the link as saved and lock the row, the movement was loaded when the job started
+	sales_invoice = frappe.db.get_value(
+		"Meter Movement Table", row.name, "custom_sales_invoice", for_update=True
+	)
+	if sales_invoice:
+		row.custom_sales_invoice = sales_invoice
+		return "Skipped", sales_invoice, _("Sales Invoice already exists")
+
+	sales_invoice = meter_movement.create_sales_invoice_for_customer(row)
+	return "Created", sales_invoice, None
+
+
+def cancel_sales_invoice(meter_movement, row):
+	"""Return (status, sales_invoice, reason) after cancelling one row's submitted invoice"""
+	sales_invoice_name = row.get("custom_sales_invoice")
+	if not sales_invoice_name:
+		return "Skipped", None, _("No Sales Invoice linked")
+
+	if frappe.db.get_value("Sales Invoice", sales_invoice_name, "docstatus") != 1:
+		return "Skipped", sales_invoice_name, _("Sales Invoice is not submitted")
+
+	frappe.get_doc("Sales Invoice", sales_invoice_name).cancel()
+	return "Cancelled", sales_invoice_name, None
+
+
+def publish_job_progress(job, processed_rows):
+	frappe.publish_realtime(
+		PROGRESS_EVENT,
+		{
+			"job": job.name,
+			"meter_movement": job.meter_movement,
+			"action": job.action,
+			"status": job.status,
+			"processed": processed_rows,
+			"total": job.total_rows,
+		},
+		doctype="Meter Movement",
+		docname=job.meter_movement,
+	)
+
+
+@frappe.whitelist()
+def get_job_summary(job_name):
+	"""Return a job's counts and its non-successful rows, for the result table on the form"""
+	job = frappe.get_doc(JOB_DOCTYPE, job_name)
+	job.check_permission("read")
+
+	return {
+		"job": job.name,
+		"action": job.action,
+		"status": job.status,
+		"error": job.error,
+		"succeeded": job.succeeded_count,
+		"skipped": job.skipped_count,
+		"failed": job.failed_count,
+		"rows": [
+			{
+				"row_idx": result.row_idx,
+				"customer": result.customer,
+				"status": result.status,
+				"sales_invoice": result.sales_invoice,
+				"reason": result.reason,
+			}
+			for result in job.results
+			if result.status in ("Skipped", "Failed")
+		],
+	}
@@ -0,0 +1,170 @@
+# Copyright (c) 2026, alipro and contributors
+# For license information, please see license.txt
+
+"""Server-side consumption calculation for Meter Movement rows.
+
+A row whose current reading is below its previous reading is billed from, in order:
+
+- an unbilled `Meter Change Event` of the customer: the old meter's consumption up to
+  its final reading plus the new meter's consumption since its initial reading;
+- the meter's digit capacity (`Customer.custom_meter_digits`): the reading wrapped
+  around `10 ** digits`, rejecting readings that do not fit that many digits;
+
+and is otherwise billed as zero. Only events dated up to the end of the Meter Movement
+are billed, and an event is billed by a single Meter Movement. Events and digit
+capacities of all customers in the table are loaded with one query each.
+"""
+
+import frappe
+from frappe import _
+from frappe.utils import cint, flt, today
+
+
+def calculate_consumption(previous_reading, current_reading, event=None, meter_digits=0):
+	previous_reading, current_reading = cint(previous_reading), cint(current_reading)
+	meter_digits = cint(meter_digits)
+
+	if meter_digits:
+		# a reading past the meter's capacity would make the wrapped consumption negative;
+		# after a replacement the previous reading is the old meter's
+		for reading in (current_reading,) if event else (previous_reading, current_reading):
+			if reading >= 10**meter_digits:
+				frappe.throw(
+					_("Reading {0} does not fit a meter of {1} digits").format(reading, meter_digits)
+				)
+
+	if event:
+		old_meter = max(cint(event.old_final_reading) - previous_reading, 0)
+		new_meter = max(current_reading - cint(event.new_initial_reading), 0)
+		return old_meter + new_meter
+
+	if current_reading < previous_reading and meter_digits:
+		return 10**meter_digits - previous_reading + current_reading
+
+	return max(current_reading - previous_reading, 0)
+
+
+def get_pending_meter_change_events(customers, meter_movement_name=None, up_to_date=None):
+	"""Return {customer: event} of the earliest event up to `up_to_date` not billed by another
+	Meter Movement.
+
+	Meter Change Event allows one unbilled event per customer; a cancelled Meter Movement can
+	release an older one next to it, which is then billed first.
+	"""
+	if not customers:
+		return {}
+
+	events = frappe.get_all(
+		"Meter Change Event",
+		filters={"customer": ["in", customers], "event_date": ["<=", up_to_date or today()]},
+		or_filters=[["meter_movement", "is", "not set"], ["meter_movement", "=", meter_movement_name or ""]],
+		fields=["name", "customer", "old_final_reading", "new_initial_reading"],
+		order_by="event_date asc, creation asc",
+	)
+	pending = {}
+	for event in events:
+		pending.setdefault(event.customer, event)
+	return pending
+
+
+def validate_meter_change_events_not_claimed(events, meter_movement_name=None):
+	"""Reject events already billed by a row of another draft or submitted Meter Movement"""
+	if not events:
+		return
+
+	claimed = frappe.get_all(
+		"Meter Movement Table",
+		filters={
+			"parenttype": "Meter Movement",
+			"meter_change_event": ["in", [event.name for event in events]],
+			"parent": ["!=", meter_movement_name or ""],
+			"docstatus": ["<", 2],
+		},
+		fields=["meter_change_event", "parent"],
+		limit=1,
+	)
+	if claimed:
+		frappe.throw(
+			_("Meter Change Event {0} is already used by Meter Movement {1}").format(
+				claimed[0].meter_change_event, claimed[0].parent
+			)
+		)
+
+
+def calculate_meter_movement_rows(meter_movement):
+	"""Compute difference, total and total_all of every row, and the parent totals"""
+	rows = meter_movement.get("customer_table") or []
+	customers = list({row.customer_name for row in rows if row.customer_name})
+
+	events = get_pending_meter_change_events(
+		customers,
+		meter_movement.name,
+		meter_movement.get("to_date") or meter_movement.get("posting_date"),
+	)
+	validate_meter_change_events_not_claimed(list(events.values()), meter_movement.name)
+	meter_digits = (
+		dict(
+			frappe.get_all(
+				"Customer",
+				filters={"name": ["in", customers]},
+				fields=["name", "custom_meter_digits"],
+				as_list=True,
+			)
+		)
+		if customers
+		else {}
+	)
+
+	total_consumption = total_amount = 0
+	for row in rows:
+		event = events.get(row.customer_name)
+		row.meter_change_event = event.name if event else None
+
+		if row.current_reading is None or (not cint(row.current_reading) and not event):
+			# reading not entered yet
+			row.difference = 0
+		else:
+			row.difference = calculate_consumption(
+				row.previous_reading, row.current_reading, event, meter_digits.get(row.customer_name)
+			)
+
+		row.total = flt(row.difference) * flt(row.price)
+		row.total_all = flt(row.total) + flt(row.balance)
+		total_consumption += flt(row.difference)
+		total_amount += flt(row.total)
+
+	meter_movement.total_consumption = total_consumption
+	meter_movement.total = total_amount
+
+
+def link_meter_change_events(meter_movement, cancel=False):
+	"""Mark the events billed by a submitted Meter Movement, or release them on cancel"""
+	rows = [row for row in meter_movement.customer_table if row.meter_change_event]
+	if not rows:
+		return
+
+	if cancel:
+		# the released event is billed before any newer one, so the customer may have two for a while
+		pending_events = frappe.get_all(
+			"Meter Change Event",
+			filters={
+				"customer": ["in", [row.customer_name for row in rows]],
+				"meter_movement": ["is", "not set"],
+			},
+			fields=["name", "customer"],
+		)
+		for event in pending_events:
+			frappe.msgprint(
+				_("Customer {0} also has Meter Change Event {1} that is not billed yet").format(
+					event.customer, event.name
+				),
+				indicator="orange",
+			)
+
+	frappe.db.set_value(
+		"Meter Change Event",
+		{"name": ["in", [row.meter_change_event for row in rows]]},
+		"meter_movement",
+		None if cancel else meter_movement.name,
+		update_modified=False,
+	)
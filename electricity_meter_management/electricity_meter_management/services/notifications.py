@@ -0,0 +1,273 @@
+# Copyright (c) 2026, alipro and contributors
+# For license information, please see license.txt
+
+"""Asynchronous fan-out of customer bills after a Meter Movement is submitted.
+
+Submitting a Meter Movement only enqueues `queue_bill_notifications`, which writes one
+`Bill Notification` per row and channel in bulk. Delivery happens in the scheduler's
+`process_bill_notifications` job, which runs every minute, sends at most `rate_limit`
+messages per channel per run and retries failures with exponential backoff. Cancelling the Meter Movement
+marks its notifications that are still queued as Cancelled.
+
+Channels are pluggable through the `bill_notification_channels` hook
+(`{"name": "dotted.path.to.ChannelClass"}`) and enabled per site with the
+`bill_notification_channels` site config key, e.g. `["sms", "email"]`.
+"""
+
+import frappe
+from frappe import _
+from frappe.utils import add_to_date, cint, flt, now_datetime
+
+NOTIFICATION_DOCTYPE = "Bill Notification"
+MAX_ATTEMPTS = 5
+
+
+class NotificationChannel:
+	"""Base class for bill delivery channels"""
+
+	# Customer field holding this channel's address
+	recipient_field = None
+	# messages sent per scheduler run, i.e. per minute
+	rate_limit = 60
+
+	def __init__(self, name):
+		self.name = name
+		rate_limits = frappe.conf.get("bill_notification_rate_limits") or {}
+		self.rate_limit = cint(rate_limits.get(name)) or self.rate_limit
+
+	def send(self, recipient, subject, message):
+		"""Deliver one message, raising on failure"""
+		raise NotImplementedError
+
+
+class EmailChannel(NotificationChannel):
+	recipient_field = "email_id"
+
+	def send(self, recipient, subject, message):
+		frappe.sendmail(recipients=[recipient], subject=subject, message=message, delayed=False)
+
+
+class SMSChannel(NotificationChannel):
+	recipient_field = "mobile_no"
+	rate_limit = 30
+
+	def send(self, recipient, subject, message):
+		from frappe.core.doctype.sms_settings.sms_settings import send_sms
+
+		send_sms([recipient], message, success_msg=False)
+
+
+class WebhookChannel(NotificationChannel):
+	"""POSTs the bill as JSON to the `bill_notification_webhook_url` site config URL"""
+
+	recipient_field = "name"
+
+	def send(self, recipient, subject, message):
+		import requests
+
+		url = frappe.conf.get("bill_notification_webhook_url")
+		if not url:
+			frappe.throw(_("Please set bill_notification_webhook_url in site config"))
+
+		response = requests.post(
+			url, json={"customer": recipient, "subject": subject, "message": message}, timeout=10
+		)
+		response.raise_for_status()
+
+
+def get_enabled_channels():
+	"""Return {name: channel instance} for the channels enabled in site config"""
+	registered = frappe.get_hooks("bill_notification_channels") or {}
+	channels = {}
+	for name in frappe.conf.get("bill_notification_channels") or []:
+		if name not in registered:
+			frappe.log_error(
+				message=f"Bill notification channel {name} is not registered", title="get_enabled_channels"
+			)
+			continue
+		channels[name] = frappe.get_attr(registered[name][-1])(name)
+	return channels
+
+
+def render_bill_summary(meter_movement, row):
+	"""Return (subject, message) summarising one customer's bill"""
+	subject = _("Electricity bill {0}").format(meter_movement.name1 or meter_movement.name)
+	message = _(
+		"Dear {0}, your consumption for meter {1} is {2} kWh at {3} = {4}. "
+		"Previous balance: {5}. Total due: {6}."
+	).format(
+		row.customer_name,
+		row.meter_number or "",
+		cint(row.difference),
+		flt(row.price),
+		flt(row.total),
+		flt(row.balance),
+		flt(row.total_all),
+	)
+	return subject, message
+
+
+def enqueue_bill_notifications(meter_movement):
+	"""Queue the notification fan-out of a submitted Meter Movement, if any channel is enabled"""
+	if not frappe.conf.get("bill_notification_channels"):
+		return
+
+	frappe.enqueue(
+		queue_bill_notifications,
+		queue="long",
+		enqueue_after_commit=True,
+		meter_movement_name=meter_movement.name,
+	)
+
+
+def queue_bill_notifications(meter_movement_name):
+	"""Create one queued Bill Notification per row and enabled channel, in bulk"""
+	channels = get_enabled_channels()
+	if not channels:
+		return
+
+	meter_movement = frappe.get_doc("Meter Movement", meter_movement_name)
+	if meter_movement.docstatus != 1:
+		# cancelled while this job was waiting
+		return
+
+	# a rerun must not notify anyone twice
+	already_queued = set(
+		frappe.get_all(
+			NOTIFICATION_DOCTYPE,
+			filters={"meter_movement": meter_movement_name},
+			fields=["customer", "channel"],
+			as_list=True,
+		)
+	)
+	rows = [row for row in meter_movement.customer_table if row.customer_name]
+	customers = list({row.customer_name for row in rows})
+
+	recipient_fields = list({channel.recipient_field for channel in channels.values()} | {"name"})
+	contacts = {
+		customer.name: customer
+		for customer in frappe.get_all(
+			"Customer", filters={"name": ["in", customers]}, fields=recipient_fields
+		)
+	}
+
+	now = now_datetime()
+	fields = [
+		"name",
+		"creation",
+		"modified",
+		"owner",
+		"modified_by",
+		"docstatus",
+		"meter_movement",
+		"meter_movement_row",
+		"customer",
+		"channel",
+		"recipient",
+		"status",
+		"attempts",
+		"last_error",
+		"subject",
+		"message",
+	]
+	no_address = _("Customer has no address for this channel")
+	values = []
+	for row in rows:
+		subject, message = render_bill_summary(meter_movement, row)
+		contact = contacts.get(row.customer_name) or {}
+		for name, channel in channels.items():
+			if (row.customer_name, name) in already_queued:
+				continue
+			recipient = contact.get(channel.recipient_field)
+			values.append(
+				(
+					frappe.generate_hash(length=10),
+					now,
+					now,
+					frappe.session.user,
+					frappe.session.user,
+					0,
+					meter_movement_name,
+					row.name,
+					row.customer_name,
+					name,
+					recipient,
+					"Queued" if recipient else "Failed",
+					0,
+					None if recipient else no_address,
+					subject,
+					message,
+				)
+			)
+
+	if values:
+		frappe.db.bulk_insert(NOTIFICATION_DOCTYPE, fields, values)
+
+
+def cancel_bill_notifications(meter_movement):
+	"""Keep the still-queued notifications of a cancelled Meter Movement from being sent"""
+	frappe.db.set_value(
+		NOTIFICATION_DOCTYPE,
+		{"meter_movement": meter_movement.name, "status": "Queued"},
+		{"status": "Cancelled", "last_error": _("Meter Movement was cancelled")},
+		update_modified=False,
+	)
+
+
+def process_bill_notifications():
+	"""Scheduler job: deliver due notifications, at most `rate_limit` per channel"""
+	for name, channel in get_enabled_channels().items():
+		due = frappe.get_all(
+			NOTIFICATION_DOCTYPE,
+			filters={"status": "Queued", "channel": name},
+			or_filters=[["next_attempt_at", "is", "not set"], ["next_attempt_at", "<=", now_datetime()]],
+			fields=["name", "recipient", "subject", "message", "attempts"],
+			order_by="creation asc",
+			limit=channel.rate_limit,
+		)
+		for notification in due:
+			deliver_notification(channel, notification)
+			# a worker dying mid-batch must not leave delivered messages Queued to be sent again
+			frappe.db.commit()
+
+
+def deliver_notification(channel, notification):
+	"""Send one notification and record the outcome, scheduling a retry on failure"""
+	attempts = cint(notification.attempts) + 1
+	try:
+		channel.send(notification.recipient, notification.subject, notification.message)
+	except Exception as e:
+		retry = attempts < MAX_ATTEMPTS
+		frappe.db.set_value(
+			NOTIFICATION_DOCTYPE,
+			notification.name,
+			{
+				"status": "Queued" if retry else "Failed",
+				"attempts": attempts,
+				"last_error": str(e),
+				"next_attempt_at": add_to_date(now_datetime(), minutes=2**attempts) if retry else None,
+			},
+			update_modified=False,
+		)
+		return
+
+	frappe.db.set_value(
+		NOTIFICATION_DOCTYPE,
+		notification.name,
+		{"status": "Sent", "attempts": attempts, "sent_at": now_datetime(), "last_error": None},
+		update_modified=False,
+	)
+
+
+@frappe.whitelist()
+def get_bill_notification_status(meter_movement_name):
+	"""Return the number of queued, sent and failed notifications of a Meter Movement"""
+	frappe.has_permission("Meter Movement", "read", meter_movement_name, throw=True)
+
+	counts = frappe.get_all(
+		NOTIFICATION_DOCTYPE,
+		filters={"meter_movement": meter_movement_name},
+		fields=["status", "count(name) as count"],
+		group_by="status",
+	)
+	return {row.status: row.count for row in counts}
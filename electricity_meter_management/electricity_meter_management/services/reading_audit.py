@@ -0,0 +1,108 @@
+# Copyright (c) 2026, alipro and contributors
+# For license information, please see license.txt
+
+"""Compact audit trail of `current_reading` edits on Meter Movement rows.
+
+Standard versioning is off for Meter Movement because whole-document diffs of a
+large `customer_table` are huge. Instead every save writes one narrow
+`Meter Reading Log` row per changed reading, in a single bulk insert.
+"""
+
+import frappe
+from frappe import _
+from frappe.utils import cint, now_datetime
+
+LOG_DOCTYPE = "Meter Reading Log"
+
+
+def get_reading_changes(meter_movement):
+	"""Return the rows whose `current_reading` differs from the last saved version"""
+	before = meter_movement.get_doc_before_save()
+	old_readings = {row.name: row.current_reading for row in (before.customer_table if before else [])}
+
+	changes = []
+	for row in meter_movement.customer_table:
+		old = old_readings.get(row.name)
+		if row.current_reading is None or (old is not None and cint(old) == cint(row.current_reading)):
+			continue
+		if old is None and not cint(row.current_reading):
+			continue
+		changes.append((row, old))
+	return changes
+
+
+def log_reading_changes(meter_movement):
+	"""Bulk insert a Meter Reading Log row for every changed reading of this save"""
+	changes = get_reading_changes(meter_movement)
+	if not changes:
+		return
+
+	now = now_datetime()
+	user = frappe.session.user
+	fields = [
+		"name",
+		"creation",
+		"modified",
+		"owner",
+		"modified_by",
+		"docstatus",
+		"meter_movement",
+		"meter_movement_row",
+		"customer",
+		"meter_number",
+		"old_reading",
+		"new_reading",
+		"user",
+		"timestamp",
+	]
+	values = [
+		(
+			frappe.generate_hash(length=10),
+			now,
+			now,
+			user,
+			user,
+			0,
+			meter_movement.name,
+			row.name,
+			row.customer_name,
+			row.meter_number,
+			old,
+			row.current_reading,
+			user,
+			now,
+		)
+		for row, old in changes
+	]
+	frappe.db.bulk_insert(LOG_DOCTYPE, fields, values)
+
+
+@frappe.whitelist()
+def get_meter_reading_history(meter_number=None, customer=None, limit=100):
+	"""Return the reading edits of one meter (or customer) across Meter Movements, newest first"""
+	frappe.has_permission("Meter Movement", "read", throw=True)
+
+	if not meter_number and not customer:
+		frappe.throw(_("Please specify a meter number or a customer"))
+
+	filters = {}
+	if meter_number:
+		filters["meter_number"] = cint(meter_number)
+	if customer:
+		filters["customer"] = customer
+
+	return frappe.get_all(
+		LOG_DOCTYPE,
+		filters=filters,
+		fields=[
+			"meter_movement",
+			"customer",
+			"meter_number",
+			"old_reading",
+			"new_reading",
+			"user",
+			"timestamp",
+		],
+		order_by="timestamp desc",
+		limit=cint(limit),
+	)
@@ -0,0 +1,210 @@
+# Copyright (c) 2026, alipro and contributors
+# For license information, please see license.txt
+
+"""Customer statements over meter readings, Sales Invoices and GL Entries.
+
+Statements are built for a batch of customers at once with one query each for
+opening balances, GL Entries and meter readings, then a running balance is computed
+in memory. Bulk generation walks an Electricity Type's customers in chunks of
+`STATEMENT_CHUNK_SIZE`, attaching each rendered PDF to its Customer in place of the
+one of an earlier run for the same period, so memory use does not grow with the
+number of customers.
+"""
+
+import frappe
+from frappe import _
+from frappe.utils import flt, getdate
+
+STATEMENT_CHUNK_SIZE = 100
+STATEMENT_TEMPLATE = "electricity_meter_management/templates/customer_statement.html"
+
+
+def get_statements(customers, from_date, to_date):
+	"""Return {customer: statement} for `customers` between `from_date` and `to_date`"""
+	if not customers:
+		return {}
+
+	from_date, to_date = getdate(from_date), getdate(to_date)
+	opening_balances = get_opening_balances(customers, from_date)
+	gl_entries = get_gl_entries(customers, from_date, to_date)
+	readings = get_readings_by_invoice(
+		{entry.voucher_no for entry in gl_entries if entry.voucher_type == "Sales Invoice"}
+	)
+	customer_names = dict(
+		frappe.get_all(
+			"Customer", filters={"name": ["in", customers]}, fields=["name", "customer_name"], as_list=True
+		)
+	)
+
+	statements = {
+		customer: frappe._dict(
+			customer=customer,
+			customer_name=customer_names.get(customer) or customer,
+			from_date=from_date,
+			to_date=to_date,
+			opening_balance=flt(opening_balances.get(customer)),
+			lines=[],
+		)
+		for customer in customers
+	}
+
+	balances = {customer: statement.opening_balance for customer, statement in statements.items()}
+	for entry in gl_entries:
+		balances[entry.party] += flt(entry.debit) - flt(entry.credit)
+		entry.balance = balances[entry.party]
+		entry.reading = readings.get(entry.voucher_no)
+		statements[entry.party].lines.append(entry)
+
+	for customer, statement in statements.items():
+		statement.total_debit = sum(flt(line.debit) for line in statement.lines)
+		statement.total_credit = sum(flt(line.credit) for line in statement.lines)
+		statement.closing_balance = balances[customer]
+
+	return statements
+
+
+def get_opening_balances(customers, from_date):
+	return dict(
+		frappe.db.sql(
+			"""
+			SELECT party, SUM(debit - credit)
+			FROM `tabGL Entry`
+			WHERE party_type = 'Customer'
+			  AND party IN %(customers)s
+			  AND posting_date < %(from_date)s
+			  AND is_cancelled = 0
+			GROUP BY party
+			""",
+			{"customers": tuple(customers), "from_date": from_date},
+		)
+	)
+
+
+def get_gl_entries(customers, from_date, to_date):
+	"""GL Entries of the period, one line per customer and voucher, in posting order"""
+	return frappe.db.sql(
+		"""
+		SELECT party, posting_date, voucher_type, voucher_no,
+			SUM(debit) AS debit, SUM(credit) AS credit, MIN(creation) AS creation
+		FROM `tabGL Entry`
+		WHERE party_type = 'Customer'
+		  AND party IN %(customers)s
+		  AND posting_date BETWEEN %(from_date)s AND %(to_date)s
+		  AND is_cancelled = 0
+		GROUP BY party, posting_date, voucher_type, voucher_no
+		ORDER BY party, posting_date, creation
+		""",
+		{"customers": tuple(customers), "from_date": from_date, "to_date": to_date},
+		as_dict=True,
+	)
+
+
+def get_readings_by_invoice(sales_invoices):
+	"""Meter readings of submitted Meter Movements, keyed by their Sales Invoice"""
+	if not sales_invoices:
+		return {}
+
+	readings = frappe.db.sql(
+		"""
+		SELECT mmt.custom_sales_invoice, mmt.meter_number, mmt.previous_reading,
+			mmt.current_reading, mmt.difference, mmt.price
+		FROM `tabMeter Movement Table` mmt
+		INNER JOIN `tabMeter Movement` mm ON mm.name = mmt.parent
+		WHERE mmt.custom_sales_invoice IN %(sales_invoices)s
+		  AND mm.docstatus = 1
+		""",
+		{"sales_invoices": tuple(sales_invoices)},
+		as_dict=True,
+	)
+	return {reading.custom_sales_invoice: reading for reading in readings}
+
+
+def render_statement_pdf(statement):
+	# the PDF toolchain is heavy, import it only when a statement is rendered
+	from frappe.utils.pdf import get_pdf
+
+	html = frappe.render_template(
+		STATEMENT_TEMPLATE,
+		{"statement": statement, "company": frappe.defaults.get_user_default("Company")},
+	)
+	return get_pdf(html)
+
+
+def get_statement_file_name(customer, from_date, to_date):
+	return f"Statement-{customer}-{from_date}-{to_date}.pdf"
+
+
+@frappe.whitelist()
+def download_customer_statement(customer, from_date, to_date):
+	"""Return one customer's statement as a PDF download"""
+	frappe.has_permission("Customer", "read", customer, throw=True)
+
+	statement = get_statements([customer], from_date, to_date)[customer]
+	frappe.local.response.filename = get_statement_file_name(customer, from_date, to_date)
+	frappe.local.response.filecontent = render_statement_pdf(statement)
+	frappe.local.response.type = "pdf"
+
+
+@frappe.whitelist()
+def enqueue_electricity_type_statements(electricity_type, from_date, to_date):
+	"""Queue statement generation for every active customer of an Electricity Type"""
+	frappe.only_for(("System Manager", "Accounts Manager"))
+
+	frappe.enqueue(
+		generate_electricity_type_statements,
+		queue="long",
+		timeout=7200,
+		electricity_type=electricity_type,
+		from_date=from_date,
+		to_date=to_date,
+	)
+	frappe.msgprint(_("Statement generation has been queued"), alert=True)
+
+
+def generate_electricity_type_statements(electricity_type, from_date, to_date):
+	"""Attach a statement PDF to every active customer of an Electricity Type, chunk by chunk"""
+	customers = frappe.get_all(
+		"Customer",
+		filters={"custom_electricity_type": electricity_type, "disabled": 0},
+		pluck="name",
+		order_by="name asc",
+	)
+
+	for start in range(0, len(customers), STATEMENT_CHUNK_SIZE):
+		chunk = customers[start : start + STATEMENT_CHUNK_SIZE]
+		delete_statement_files(chunk, from_date, to_date)
+		for customer, statement in get_statements(chunk, from_date, to_date).items():
+			frappe.get_doc(
+				{
+					"doctype": "File",
+					"file_name": get_statement_file_name(customer, from_date, to_date),
+					"attached_to_doctype": "Customer",
+					"attached_to_name": customer,
+					"is_private": 1,
+					"content": render_statement_pdf(statement),
+				}
+			).insert(ignore_permissions=True)
+
+		frappe.db.commit()
+		frappe.publish_progress(
+			min(start + STATEMENT_CHUNK_SIZE, len(customers)) * 100 / len(customers),
+			title=_("Generating Statements"),
+		)
+
+
+def delete_statement_files(customers, from_date, to_date):
+	"""Delete statements of the same period attached by an earlier run, so a rerun replaces them"""
+	files = frappe.get_all(
+		"File",
+		filters={
+			"attached_to_doctype": "Customer",
+			"attached_to_name": ["in", customers],
+			"file_name": [
+				"in",
+				[get_statement_file_name(customer, from_date, to_date) for customer in customers],
+			],
+		},
+		pluck="name",
+	)
+	for file in files:
+		frappe.delete_doc("File", file, ignore_permissions=True)
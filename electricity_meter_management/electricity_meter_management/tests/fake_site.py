@@ -0,0 +1,746 @@
+# Copyright (c) 2026, alipro and contributors
+# For license information, please see license.txt
+
+"""Local stand-in for the parts of a Frappe site the app's hot paths use.
+
+`fake_site()` puts a minimal `frappe` package backed by an in-memory SQLite database
+in `sys.modules`, so fresh copies of the app modules import against it, and restores
+the real modules on exit. Tables are created from the app's DocType and custom field
+JSON plus the few ERPNext fields the app reads.
+
+Every call the app makes through `frappe.db`, `frappe.get_all`, `frappe.get_doc` and
+the document methods is recorded in `site.queries` as `(kind, doctype)`, so a test can
+compare the counts of a workload at different row counts and catch N+1 queries and
+per-row `set_value` calls without a bench.
+"""
+
+import datetime
+import importlib
+import json
+import re
+import secrets
+import sqlite3
+import sys
+import types
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+
+APP_PATH = Path(__file__).resolve().parents[1]
+APP_MODULE = "electricity_meter_management.electricity_meter_management"
+
+STANDARD_COLUMNS = [
+	"name",
+	"creation",
+	"modified",
+	"modified_by",
+	"owner",
+	"docstatus",
+	"idx",
+	"parent",
+	"parentfield",
+	"parenttype",
+]
+NO_VALUE_FIELDTYPES = {
+	"Section Break",
+	"Column Break",
+	"Tab Break",
+	"HTML",
+	"Button",
+	"Heading",
+	"Fold",
+	"Image",
+	"Table",
+	"Table MultiSelect",
+}
+
+# fields of ERPNext doctypes the app reads or writes; app fields come from its JSON
+ERPNEXT_FIELDS = {
+	"Company": ["company_name", "default_currency"],
+	"Customer": ["customer_name", "customer_type", "disabled", "default_price_list", "email_id", "mobile_no"],
+	"GL Entry": [
+		"posting_date",
+		"party_type",
+		"party",
+		"debit",
+		"credit",
+		"voucher_type",
+		"voucher_no",
+		"is_cancelled",
+	],
+	"Sales Invoice": [
+		"customer",
+		"posting_date",
+		"company",
+		"currency",
+		"selling_price_list",
+		"custom_reference_number",
+		"remarks",
+	],
+	"Sales Invoice Item": ["item_code", "qty", "rate", "amount", "description"],
+}
+ERPNEXT_TABLES = {"Sales Invoice": {"items": "Sales Invoice Item"}}
+
+_site = None
+
+
+class _dict(dict):
+	__getattr__ = dict.get
+	__setattr__ = dict.__setitem__
+	__delattr__ = dict.__delitem__
+
+	def copy(self):
+		return _dict(self)
+
+
+class ValidationError(Exception):
+	pass
+
+
+class DoesNotExistError(ValidationError):
+	pass
+
+
+class Meta:
+	def __init__(self, doctype, fields):
+		self.name = doctype
+		self.fields = [_dict(field) for field in fields]
+
+	@property
+	def columns(self):
+		return [field.fieldname for field in self.fields if field.fieldtype not in NO_VALUE_FIELDTYPES]
+
+	def get_table_fields(self):
+		return [field for field in self.fields if field.fieldtype == "Table"]
+
+	def has_field(self, fieldname):
+		return any(field.fieldname == fieldname for field in self.fields)
+
+
+def load_schema():
+	"""Return {doctype: Meta} for the app doctypes and the ERPNext doctypes it touches"""
+	fields = {
+		doctype: [{"fieldname": f, "fieldtype": "Data"} for f in names]
+		for doctype, names in ERPNEXT_FIELDS.items()
+	}
+	for doctype, tables in ERPNEXT_TABLES.items():
+		fields[doctype] += [
+			{"fieldname": f, "fieldtype": "Table", "options": child} for f, child in tables.items()
+		]
+
+	for path in APP_PATH.glob("doctype/*/*.json"):
+		definition = json.loads(path.read_text())
+		if definition.get("doctype") == "DocType" and path.stem == path.parent.name:
+			fields[definition["name"]] = definition["fields"]
+
+	for path in APP_PATH.glob("custom/*.json"):
+		customization = json.loads(path.read_text())
+		for custom_field in customization.get("custom_fields", []):
+			doctype = (
+				custom_field.get("dt") or customization.get("doctype") or path.stem.replace("_", " ").title()
+			)
+			fields.setdefault(doctype, []).append(custom_field)
+
+	return {doctype: Meta(doctype, doctype_fields) for doctype, doctype_fields in fields.items()}
+
+
+def adapt(value):
+	if isinstance(value, datetime.date | datetime.datetime):
+		return value.isoformat(sep=" ") if isinstance(value, datetime.datetime) else value.isoformat()
+	return value
+
+
+def build_conditions(filters):
+	"""Return (sql, params) for Frappe style dict or list filters, joined with AND"""
+	if not filters:
+		return [], []
+	if isinstance(filters, str):
+		filters = {"name": filters}
+
+	if isinstance(filters, dict):
+		items = [
+			(field, *value) if isinstance(value, list | tuple) else (field, "=", value)
+			for field, value in filters.items()
+		]
+	else:
+		items = [tuple(f[-3:]) for f in filters]
+
+	conditions, params = [], []
+	for field, operator, value in items:
+		operator = operator.lower()
+		column = f"`{field}`"
+		if operator in ("in", "not in"):
+			values = [adapt(v) for v in value]
+			if not values:
+				conditions.append("1 = 0" if operator == "in" else "1 = 1")
+				continue
+			conditions.append(f"{column} {operator} ({', '.join('?' * len(values))})")
+			params += values
+		elif operator == "is":
+			conditions.append(
+				f"({column} IS NOT NULL AND {column} != '')"
+				if value == "set"
+				else f"({column} IS NULL OR {column} = '')"
+			)
+		elif operator == "between":
+			conditions.append(f"{column} BETWEEN ? AND ?")
+			params += [adapt(v) for v in value]
+		elif value is None and operator in ("=", "!="):
+			conditions.append(f"{column} IS {'NOT ' if operator == '!=' else ''}NULL")
+		else:
+			conditions.append(f"{column} {operator} ?")
+			params.append(adapt(value))
+	return conditions, params
+
+
+class FakeDatabase:
+	"""`frappe.db` over SQLite; every public call is recorded on the site"""
+
+	def __init__(self, site):
+		self.site = site
+		self.connection = sqlite3.connect(":memory:", isolation_level=None)
+		for doctype, meta in site.schema.items():
+			columns = STANDARD_COLUMNS + [c for c in meta.columns if c not in STANDARD_COLUMNS]
+			self.execute(
+				f"CREATE TABLE `tab{doctype}` ({', '.join(f'`{c}`' for c in columns)}, PRIMARY KEY (`name`))"
+			)
+
+	def execute(self, query, params=()):
+		"""Run a statement without recording it, for the site's own bookkeeping"""
+		return self.connection.execute(query, params)
+
+	def sql(self, query, values=(), as_dict=False, as_list=False, **kwargs):
+		self.site.record("sql", None)
+		query, params = self.to_sqlite(query, values)
+		cursor = self.execute(query, params)
+		if not cursor.description:
+			return ()
+
+		columns = [column[0] for column in cursor.description]
+		rows = cursor.fetchall()
+		if as_dict:
+			return [_dict(zip(columns, row, strict=True)) for row in rows]
+		if as_list:
+			return [list(row) for row in rows]
+		return tuple(rows)
+
+	@staticmethod
+	def to_sqlite(query, values):
+		"""Convert MariaDB `%s` / `%(key)s` placeholders, expanding tuples for `IN`"""
+		if isinstance(values, dict):
+			params = {}
+
+			def expand(match):
+				key, value = match.group(1), values[match.group(1)]
+				if isinstance(value, list | tuple):
+					keys = [f"{key}_{i}" for i in range(len(value))]
+					params.update({k: adapt(v) for k, v in zip(keys, value, strict=True)})
+					return f"({', '.join(':' + k for k in keys)})"
+				params[key] = adapt(value)
+				return f":{key}"
+
+			return re.sub(r"%\((\w+)\)s", expand, query), params
+
+		return query.replace("%s", "?"), [adapt(v) for v in values or ()]
+
+	def get_all(
+		self,
+		doctype,
+		filters=None,
+		fields=None,
+		or_filters=None,
+		order_by=None,
+		group_by=None,
+		limit_page_length=None,
+		limit=None,
+		pluck=None,
+		as_list=False,
+		record=True,
+		**kwargs,
+	):
+		if record:
+			self.site.record("get_all", doctype)
+		if pluck:
+			fields = [pluck]
+		fields = fields or ["name"]
+		if isinstance(fields, str):
+			fields = [fields]
+
+		conditions, params = build_conditions(filters)
+		if or_filters:
+			or_conditions, or_params = build_conditions(or_filters)
+			conditions.append(f"({' OR '.join(or_conditions)})")
+			params += or_params
+
+		query = f"SELECT {', '.join(fields)} FROM `tab{doctype}`"
+		if conditions:
+			query += f" WHERE {' AND '.join(conditions)}"
+		if group_by:
+			query += f" GROUP BY {group_by}"
+		if order_by:
+			query += f" ORDER BY {order_by}"
+		if limit_page_length or limit:
+			query += f" LIMIT {int(limit_page_length or limit)}"
+
+		cursor = self.execute(query, params)
+		columns = [column[0] for column in cursor.description]
+		rows = cursor.fetchall()
+		if pluck:
+			return [row[0] for row in rows]
+		if as_list:
+			return [tuple(row) for row in rows]
+		return [_dict(zip(columns, row, strict=True)) for row in rows]
+
+	def get_value(self, doctype, filters=None, fieldname="name", as_dict=False, for_update=False, **kwargs):
+		self.site.record("get_value", doctype)
+		fields = fieldname if isinstance(fieldname, list | tuple) else [fieldname]
+		rows = self.get_all(
+			doctype, filters=filters or {"name": doctype}, fields=fields, limit=1, record=False
+		)
+		if not rows:
+			return None
+		if as_dict:
+			return rows[0]
+		values = tuple(rows[0].values())
+		return values if isinstance(fieldname, list | tuple) else values[0]
+
+	def get_single_value(self, doctype, fieldname, cache=True):
+		self.site.record("get_single_value", doctype)
+		return self.site.singles.get((doctype, fieldname))
+
+	def exists(self, doctype, filters=None, **kwargs):
+		self.site.record("exists", doctype)
+		rows = self.get_all(doctype, filters=filters, limit=1, pluck="name", record=False)
+		return rows[0] if rows else None
+
+	def set_value(self, doctype, name, fieldname, value=None, update_modified=True, **kwargs):
+		self.site.record("set_value", doctype)
+		values = fieldname if isinstance(fieldname, dict) else {fieldname: value}
+		conditions, params = build_conditions(name)
+		assignments = ", ".join(f"`{field}` = ?" for field in values)
+		self.execute(
+			f"UPDATE `tab{doctype}` SET {assignments} WHERE {' AND '.join(conditions)}",
+			[adapt(v) for v in values.values()] + params,
+		)
+
+	def bulk_insert(self, doctype, fields, values, ignore_duplicates=False, chunk_size=10_000):
+		self.site.record("bulk_insert", doctype)
+		self.connection.executemany(
+			f"INSERT INTO `tab{doctype}` ({', '.join(f'`{f}`' for f in fields)}) VALUES ({', '.join('?' * len(fields))})",
+			[[adapt(v) for v in row] for row in values],
+		)
+
+	def delete(self, doctype, filters=None):
+		self.site.record("delete", doctype)
+		conditions, params = build_conditions(filters)
+		self.execute(f"DELETE FROM `tab{doctype}` WHERE {' AND '.join(conditions) or '1 = 1'}", params)
+
+	def savepoint(self, save_point):
+		self.site.record("savepoint", None)
+		self.execute(f"SAVEPOINT {save_point}")
+
+	def rollback(self, save_point=None):
+		self.site.record("rollback", None)
+		if save_point:
+			self.execute(f"ROLLBACK TO SAVEPOINT {save_point}")
+		elif self.connection.in_transaction:
+			self.execute("ROLLBACK")
+
+	def commit(self):
+		self.site.record("commit", None)
+		if self.connection.in_transaction:
+			self.execute("COMMIT")
+
+	def insert_rows(self, doctype, rows):
+		"""Write `rows` (dicts) without recording them, e.g. for test fixtures"""
+		for row in rows:
+			row.setdefault("docstatus", 0)
+			fields = list(row)
+			self.execute(
+				f"INSERT OR REPLACE INTO `tab{doctype}` ({', '.join(f'`{f}`' for f in fields)}) "
+				f"VALUES ({', '.join('?' * len(fields))})",
+				[adapt(row[f]) for f in fields],
+			)
+
+
+class Document:
+	"""The subset of `frappe.model.document.Document` the app's controllers rely on"""
+
+	def __init__(self, *args, **kwargs):
+		data = dict(args[0]) if args and isinstance(args[0], dict) else kwargs
+		self.doctype = data.pop("doctype")
+		self.flags = _dict()
+		self._doc_before_save = None
+
+		meta = _site.schema[self.doctype]
+		for fieldname in meta.columns:
+			setattr(self, fieldname, None)
+		for fieldname in STANDARD_COLUMNS:
+			setattr(self, fieldname, None)
+		self.docstatus = 0
+		for df in meta.get_table_fields():
+			setattr(self, df.fieldname, [])
+
+		for key, value in data.items():
+			if isinstance(value, list) and meta.has_field(key):
+				self.extend(key, value)
+			else:
+				setattr(self, key, value)
+
+	@property
+	def meta(self):
+		return _site.schema[self.doctype]
+
+	def get(self, key, default=None):
+		return self.__dict__.get(key, default)
+
+	def set(self, key, value):
+		setattr(self, key, value)
+
+	def append(self, fieldname, value=None):
+		child_doctype = next(df.options for df in self.meta.get_table_fields() if df.fieldname == fieldname)
+		row = _dict({column: None for column in _site.schema[child_doctype].columns})
+		row.update(value or {})
+		rows = getattr(self, fieldname)
+		row.update(doctype=child_doctype, parentfield=fieldname, parenttype=self.doctype, idx=len(rows) + 1)
+		rows.append(row)
+		return row
+
+	def extend(self, fieldname, values):
+		for value in values:
+			self.append(fieldname, value)
+
+	def as_dict(self):
+		return _dict({k: v for k, v in self.__dict__.items() if not k.startswith("_") and k != "flags"})
+
+	def check_permission(self, permtype="read"):
+		pass
+
+	def run_method(self, method, *args, **kwargs):
+		if callable(getattr(self, method, None)):
+			return getattr(self, method)(*args, **kwargs)
+
+	def get_doc_before_save(self):
+		return self._doc_before_save
+
+	def has_value_changed(self, fieldname):
+		before = self.get_doc_before_save()
+		return not before or before.get(fieldname) != self.get(fieldname)
+
+	def insert(self, ignore_permissions=None, ignore_links=None, ignore_mandatory=None, **kwargs):
+		_site.record("insert", self.doctype)
+		self.run_method("before_insert")
+		if not self.name:
+			self.run_method("autoname")
+			self.name = self.name or _site.generate_hash(length=10)
+		self.run_method("validate")
+		self.run_method("before_save")
+		self.db_write()
+		self.run_method("after_insert")
+		self.run_method("on_update")
+		return self
+
+	def save(self, ignore_permissions=None, **kwargs):
+		_site.record("save", self.doctype)
+		self._doc_before_save = _site.load(self.doctype, self.name)
+		if self.docstatus == 1:
+			self.run_method("before_update_after_submit")
+			self.db_write()
+			self.run_method("on_update_after_submit")
+		else:
+			self.run_method("validate")
+			self.run_method("before_save")
+			self.db_write()
+			self.run_method("on_update")
+		return self
+
+	def submit(self):
+		_site.record("submit", self.doctype)
+		self._doc_before_save = _site.load(self.doctype, self.name)
+		self.docstatus = 1
+		self.run_method("validate")
+		self.run_method("before_submit")
+		self.db_write()
+		self.run_method("on_update")
+		self.run_method("on_submit")
+		return self
+
+	def cancel(self):
+		_site.record("cancel", self.doctype)
+		self._doc_before_save = _site.load(self.doctype, self.name)
+		self.docstatus = 2
+		self.run_method("before_cancel")
+		self.db_write()
+		self.run_method("on_cancel")
+		return self
+
+	def reload(self):
+		_site.record("get_doc", self.doctype)
+		self.__dict__.update(_site.load(self.doctype, self.name).__dict__)
+		return self
+
+	def db_set(self, fieldname, value=None, update_modified=True, **kwargs):
+		values = fieldname if isinstance(fieldname, dict) else {fieldname: value}
+		for key, val in values.items():
+			setattr(self, key, val)
+		_site.db.set_value(self.doctype, self.name, values, update_modified=update_modified)
+
+	def db_write(self):
+		"""Persist the document and its child rows the way the framework does, unrecorded"""
+		now = datetime.datetime.now()
+		self.creation = self.creation or now
+		self.modified = now
+		db = _site.db
+		db.insert_rows(
+			self.doctype,
+			[{c: self.get(c) for c in ["name", "creation", "modified", "docstatus", *self.meta.columns]}],
+		)
+
+		for df in self.meta.get_table_fields():
+			db.execute(
+				f"DELETE FROM `tab{df.options}` WHERE parent = ? AND parentfield = ?",
+				(self.name, df.fieldname),
+			)
+			columns = STANDARD_COLUMNS + _site.schema[df.options].columns
+			for row in getattr(self, df.fieldname):
+				row.name = row.name or _site.generate_hash(length=10)
+				row.parent, row.docstatus = self.name, self.docstatus
+				db.insert_rows(df.options, [{c: row.get(c) for c in dict.fromkeys(columns)}])
+
+
+class FakeSite:
+	def __init__(self):
+		self.schema = load_schema()
+		self.queries = []
+		self.error_log = []
+		self.enqueued = []
+		self.defaults = {}
+		self.singles = {}
+		self.conf = _dict()
+		self.db = FakeDatabase(self)
+		self.frappe = build_frappe_module(self)
+
+	def record(self, kind, doctype):
+		self.queries.append((kind, doctype))
+
+	def reset_queries(self):
+		self.queries.clear()
+
+	def query_counts(self):
+		"""Return a Counter of the recorded calls by (kind, doctype)"""
+		return Counter(self.queries)
+
+	@staticmethod
+	def generate_hash(txt=None, length=56):
+		return secrets.token_hex(length)[:length]
+
+	def get_controller(self, doctype):
+		module_name = doctype.lower().replace(" ", "_")
+		if not (APP_PATH / "doctype" / module_name).is_dir():
+			return Document
+		module = importlib.import_module(f"{APP_MODULE}.doctype.{module_name}.{module_name}")
+		return getattr(module, doctype.replace(" ", ""))
+
+	def load(self, doctype, name):
+		rows = self.db.get_all(doctype, filters={"name": name}, fields=["*"], record=False)
+		if not rows:
+			raise DoesNotExistError(f"{doctype} {name} not found")
+
+		data = rows[0]
+		for df in self.schema[doctype].get_table_fields():
+			data[df.fieldname] = self.db.get_all(
+				df.options,
+				filters={"parent": name, "parentfield": df.fieldname},
+				fields=["*"],
+				order_by="idx asc",
+				record=False,
+			)
+		return self.get_controller(doctype)({"doctype": doctype, **data})
+
+	def get_doc(self, *args, **kwargs):
+		if args and isinstance(args[0], dict):
+			return self.get_controller(args[0]["doctype"])(args[0])
+		if kwargs.get("doctype") and len(args) < 2:
+			return self.get_controller(kwargs["doctype"])(kwargs)
+
+		self.record("get_doc", args[0])
+		return self.load(*args[:2])
+
+	def new_doc(self, doctype, **kwargs):
+		return self.get_controller(doctype)({"doctype": doctype})
+
+	def delete_doc(self, doctype, name, **kwargs):
+		self.record("delete_doc", doctype)
+		self.db.execute(f"DELETE FROM `tab{doctype}` WHERE name = ?", (name,))
+		for df in self.schema[doctype].get_table_fields():
+			self.db.execute(f"DELETE FROM `tab{df.options}` WHERE parent = ?", (name,))
+
+	def log_error(self, title=None, message=None, **kwargs):
+		self.error_log.append(_dict(title=title, message=message))
+
+
+def build_utils_module():
+	utils = types.ModuleType("frappe.utils")
+
+	def cint(s, default=0):
+		try:
+			return int(float(s))
+		except (TypeError, ValueError):
+			return default
+
+	def flt(s, precision=None):
+		try:
+			number = float(s)
+		except (TypeError, ValueError):
+			number = 0.0
+		return round(number, precision) if precision is not None else number
+
+	def getdate(value=None):
+		if not value:
+			return datetime.date.today()
+		if isinstance(value, datetime.datetime):
+			return value.date()
+		if isinstance(value, datetime.date):
+			return value
+		return datetime.date.fromisoformat(str(value)[:10])
+
+	def add_months(date, months):
+		date = getdate(date)
+		month = date.month - 1 + months
+		year, month = date.year + month // 12, month % 12 + 1
+		return date.replace(
+			year=year,
+			month=month,
+			day=min(date.day, get_last_day(date.replace(year=year, month=month, day=1)).day),
+		)
+
+	def get_last_day(date):
+		date = getdate(date)
+		next_month = date.replace(day=28) + datetime.timedelta(days=4)
+		return next_month - datetime.timedelta(days=next_month.day)
+
+	def add_to_date(date, days=0, hours=0, minutes=0, seconds=0, **kwargs):
+		return date + datetime.timedelta(days=days, hours=hours, minutes=minutes, seconds=seconds)
+
+	utils.cint = cint
+	utils.flt = flt
+	utils.cstr = lambda s: "" if s is None else str(s)
+	utils.getdate = getdate
+	utils.get_first_day = lambda date: getdate(date).replace(day=1)
+	utils.get_last_day = get_last_day
+	utils.add_months = add_months
+	utils.add_days = lambda date, days: getdate(date) + datetime.timedelta(days=days)
+	utils.add_to_date = add_to_date
+	utils.now_datetime = datetime.datetime.now
+	utils.today = utils.nowdate = lambda: datetime.date.today().isoformat()
+	return utils
+
+
+def build_frappe_module(site):
+	"""Return the `frappe` module stand-in (with `frappe.utils` and `frappe.model.document`)"""
+	frappe = types.ModuleType("frappe")
+	frappe.__path__ = []
+	frappe._dict = _dict
+	frappe.ValidationError = ValidationError
+	frappe.DoesNotExistError = DoesNotExistError
+	frappe.db = site.db
+	frappe.conf = site.conf
+	frappe.flags = _dict()
+	frappe.session = _dict(user="Administrator")
+	frappe.local = _dict(message_log=[], response=_dict(), flags=frappe.flags)
+	frappe.defaults = types.SimpleNamespace(
+		get_user_default=site.defaults.get, get_global_default=site.defaults.get
+	)
+	frappe.utils = build_utils_module()
+
+	def _(msg, lang=None, context=None):
+		return msg
+
+	def throw(msg, exc=ValidationError, title=None, **kwargs):
+		raise exc(msg)
+
+	def msgprint(msg, title=None, indicator=None, alert=False, **kwargs):
+		frappe.local.message_log.append(msg)
+
+	def clear_last_message():
+		if frappe.local.message_log:
+			frappe.local.message_log.pop()
+
+	def whitelist(allow_guest=False, xss_safe=False, methods=None):
+		return lambda fn: fn
+
+	def enqueue(method, **kwargs):
+		site.enqueued.append((method, kwargs))
+
+	frappe._ = _
+	frappe.throw = throw
+	frappe.msgprint = msgprint
+	frappe.clear_last_message = clear_last_message
+	frappe.whitelist = whitelist
+	frappe.enqueue = enqueue
+	frappe.log_error = site.log_error
+	frappe.clear_document_cache = lambda doctype, name=None: site.record("clear_document_cache", doctype)
+	frappe.generate_hash = site.generate_hash
+	frappe.get_meta = lambda doctype, cached=True: site.schema[doctype]
+	frappe.get_all = frappe.get_list = site.db.get_all
+	frappe.get_doc = site.get_doc
+	frappe.new_doc = site.new_doc
+	frappe.delete_doc = site.delete_doc
+	frappe.get_hooks = lambda hook=None, default=None, app_name=None: default or {}
+	frappe.get_attr = lambda path: getattr(
+		importlib.import_module(path.rsplit(".", 1)[0]), path.rsplit(".", 1)[1]
+	)
+	frappe.has_permission = lambda *args, **kwargs: True
+	frappe.only_for = lambda *args, **kwargs: None
+	frappe.publish_realtime = lambda *args, **kwargs: None
+	frappe.publish_progress = lambda *args, **kwargs: None
+
+	model = types.ModuleType("frappe.model")
+	model.__path__ = []
+	model.document = types.ModuleType("frappe.model.document")
+	model.document.Document = Document
+	frappe.model = model
+	return frappe
+
+
+def is_site_module(name):
+	"""Modules swapped out while a fake site is active: frappe and the app, except its tests"""
+	if name == "frappe" or name.startswith("frappe."):
+		return True
+	return name.startswith("electricity_meter_management") and ".tests" not in name
+
+
+def real_frappe_loaded():
+	"""Whether the real frappe is imported, as under `bench run-tests`"""
+	return "frappe" in sys.modules
+
+
+@contextmanager
+def fake_site():
+	"""Run the block against a fresh FakeSite, with app modules re-imported against it"""
+	global _site
+
+	if real_frappe_loaded():
+		raise RuntimeError("fake_site() would replace the frappe of a running site")
+
+	saved = {name: module for name, module in sys.modules.items() if is_site_module(name)}
+	for name in saved:
+		del sys.modules[name]
+
+	_site = site = FakeSite()
+	sys.modules.update(
+		{
+			"frappe": site.frappe,
+			"frappe.utils": site.frappe.utils,
+			"frappe.model": site.frappe.model,
+			"frappe.model.document": site.frappe.model.document,
+		}
+	)
+	try:
+		yield site
+	finally:
+		for name in [name for name in sys.modules if is_site_module(name)]:
+			del sys.modules[name]
+		sys.modules.update(saved)
+		site.db.connection.close()
+		_site = None
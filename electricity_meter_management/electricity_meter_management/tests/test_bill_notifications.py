@@ -0,0 +1,88 @@
+# Copyright (c) 2026, alipro and contributors
+# For license information, please see license.txt
+
+from unittest.mock import patch
+
+import frappe
+
+from electricity_meter_management.electricity_meter_management.services import notifications
+from electricity_meter_management.electricity_meter_management.tests.utils import MeterMovementTestCase
+
+
+class StubChannel(notifications.NotificationChannel):
+	"""Local channel that records messages instead of sending them"""
+
+	recipient_field = "name"
+
+	def __init__(self, name, fail=False):
+		super().__init__(name)
+		self.fail = fail
+		self.sent = []
+
+	def send(self, recipient, subject, message):
+		if self.fail:
+			raise ConnectionError("stub channel is down")
+		self.sent.append((recipient, subject, message))
+
+
+class TestBillNotifications(MeterMovementTestCase):
+	"""Test bill notification fan-out, delivery and retries against a stub channel"""
+
+	def setUp(self):
+		super().setUp()
+		self.meter_movement = self.make_meter_movement(
+			[self.make_row(balance=20.0, total_all=520.0)], submit=True
+		)
+
+	def get_statuses(self):
+		return frappe.get_all(
+			"Bill Notification",
+			filters={"meter_movement": self.meter_movement.name},
+			fields=["status", "attempts"],
+		)
+
+	def test_notifications_sent_through_channel(self):
+		channel = StubChannel("stub")
+		with patch.object(notifications, "get_enabled_channels", return_value={"stub": channel}):
+			notifications.queue_bill_notifications(self.meter_movement.name)
+			notifications.process_bill_notifications()
+
+		self.assertEqual(len(channel.sent), 1)
+		recipient, _subject, message = channel.sent[0]
+		self.assertEqual(recipient, "Test Customer")
+		self.assertIn("520", message)
+		self.assertEqual([row.status for row in self.get_statuses()], ["Sent"])
+
+	def test_failed_delivery_is_retried(self):
+		channel = StubChannel("stub", fail=True)
+		with patch.object(notifications, "get_enabled_channels", return_value={"stub": channel}):
+			notifications.queue_bill_notifications(self.meter_movement.name)
+			notifications.process_bill_notifications()
+
+		statuses = self.get_statuses()
+		self.assertEqual(statuses[0].status, "Queued")
+		self.assertEqual(statuses[0].attempts, 1)
+
+	def test_requeue_does_not_duplicate(self):
+		channel = StubChannel("stub")
+		with patch.object(notifications, "get_enabled_channels", return_value={"stub": channel}):
+			notifications.queue_bill_notifications(self.meter_movement.name)
+			notifications.queue_bill_notifications(self.meter_movement.name)
+
+		self.assertEqual(len(self.get_statuses()), 1)
+
+	def test_cancel_stops_queued_notifications(self):
+		channel = StubChannel("stub")
+		with patch.object(notifications, "get_enabled_channels", return_value={"stub": channel}):
+			notifications.queue_bill_notifications(self.meter_movement.name)
+			self.meter_movement.cancel()
+			# a queue job still waiting when the movement was cancelled adds nothing
+			notifications.queue_bill_notifications(self.meter_movement.name)
+			notifications.process_bill_notifications()
+
+		self.assertEqual(channel.sent, [])
+		self.assertEqual([row.status for row in self.get_statuses()], ["Cancelled"])
+
+	def tearDown(self):
+		frappe.db.delete("Bill Notification", {"meter_movement": self.meter_movement.name})
+		super().tearDown()
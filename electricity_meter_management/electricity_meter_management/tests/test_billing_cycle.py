@@ -0,0 +1,74 @@
+# Copyright (c) 2026, alipro and contributors
+# For license information, please see license.txt
+
+import frappe
+from frappe.utils import add_days, add_months, getdate
+
+from electricity_meter_management.electricity_meter_management.services.billing_cycle import (
+	create_meter_movement_for_cycle,
+	get_cycle_dates,
+)
+from electricity_meter_management.electricity_meter_management.tests.utils import MeterMovementTestCase
+
+
+class TestBillingCycle(MeterMovementTestCase):
+	"""Test scheduled creation of draft Meter Movements per billing cycle"""
+
+	def setUp(self):
+		super().setUp()
+		self.electricity_type = frappe.db.get_value("Customer", "Test Customer", "custom_electricity_type")
+		frappe.db.set_value("Customer", "Test Customer", "custom_electricity_type", "Test Type")
+
+	def tearDown(self):
+		frappe.db.set_value("Customer", "Test Customer", "custom_electricity_type", self.electricity_type)
+		super().tearDown()
+
+	def test_cycle_dates(self):
+		self.assertEqual(
+			get_cycle_dates("Monthly", "2026-02-14"), (getdate("2026-02-01"), getdate("2026-02-28"))
+		)
+		self.assertEqual(
+			get_cycle_dates("Quarterly", "2026-05-20"), (getdate("2026-04-01"), getdate("2026-06-30"))
+		)
+
+	def test_draft_created_once_per_cycle(self):
+		from_date, to_date = get_cycle_dates("Monthly")
+
+		name = create_meter_movement_for_cycle("Test Type", from_date, to_date)
+		meter_movement = frappe.get_doc("Meter Movement", name)
+
+		self.assertEqual(meter_movement.docstatus, 0)
+		row = next(row for row in meter_movement.customer_table if row.customer_name == "Test Customer")
+		self.assertEqual(row.price, 10)
+		self.assertEqual(row.item_name, "Test Electricity")
+		self.assertIsNone(create_meter_movement_for_cycle("Test Type", from_date, to_date))
+
+	def test_manual_movement_for_overlapping_period_is_detected(self):
+		from_date, to_date = get_cycle_dates("Monthly")
+		manual = self.make_meter_movement(from_date=add_days(from_date, 3), to_date=add_days(to_date, 3))
+
+		self.assertIsNone(create_meter_movement_for_cycle("Test Type", from_date, to_date))
+
+		# a cancelled movement does not block the cycle
+		manual.submit()
+		manual.cancel()
+		self.assertIsNotNone(create_meter_movement_for_cycle("Test Type", from_date, to_date))
+
+	def test_movement_without_period_is_detected(self):
+		from_date, to_date = get_cycle_dates("Monthly")
+		self.make_meter_movement(posting_date=add_days(from_date, 1))
+
+		self.assertIsNone(create_meter_movement_for_cycle("Test Type", from_date, to_date))
+
+	def test_waits_until_previous_cycle_is_billed(self):
+		from_date, to_date = get_cycle_dates("Monthly")
+		previous = self.make_meter_movement(
+			posting_date=add_days(from_date, -1),
+			from_date=add_months(from_date, -1),
+			to_date=add_days(from_date, -1),
+		)
+
+		self.assertIsNone(create_meter_movement_for_cycle("Test Type", from_date, to_date))
+
+		previous.submit()
+		self.assertIsNotNone(create_meter_movement_for_cycle("Test Type", from_date, to_date))
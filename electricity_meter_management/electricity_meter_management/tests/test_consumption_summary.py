@@ -0,0 +1,56 @@
+# Copyright (c) 2026, alipro and contributors
+# For license information, please see license.txt
+
+import frappe
+
+from electricity_meter_management.electricity_meter_management.services.consumption_summary import (
+	SUMMARY_DOCTYPE,
+	get_summary_period,
+)
+from electricity_meter_management.electricity_meter_management.tests.utils import MeterMovementTestCase
+
+
+class TestConsumptionSummary(MeterMovementTestCase):
+	"""Test that the consumption summary follows Meter Movement submit and cancel"""
+
+	def get_summary(self, meter_movement):
+		return frappe.db.get_value(
+			SUMMARY_DOCTYPE,
+			{"electricity_type": "Test Type", "period": get_summary_period(meter_movement)},
+			["total_consumption", "total_amount", "customer_count", "average_consumption"],
+			as_dict=True,
+		)
+
+	def test_summary_updated_on_submit_and_cancel(self):
+		meter_movement = self.make_meter_movement()
+		meter_movement.submit()
+
+		summary = self.get_summary(meter_movement)
+		self.assertEqual(summary.total_consumption, 50)
+		self.assertEqual(summary.total_amount, 500)
+		self.assertEqual(summary.customer_count, 1)
+		self.assertEqual(summary.average_consumption, 50)
+
+		meter_movement.cancel()
+
+		summary = self.get_summary(meter_movement)
+		self.assertEqual(summary.total_consumption, 0)
+		self.assertEqual(summary.customer_count, 0)
+
+	def test_customer_counted_once_per_period(self):
+		first = self.make_meter_movement()
+		first.submit()
+		second = self.make_meter_movement()
+		second.submit()
+
+		summary = self.get_summary(second)
+		self.assertEqual(summary.total_consumption, 100)
+		self.assertEqual(summary.customer_count, 1)
+		self.assertEqual(summary.average_consumption, 100)
+
+		second.cancel()
+		self.assertEqual(self.get_summary(second).customer_count, 1)
+
+	def tearDown(self):
+		frappe.db.delete(SUMMARY_DOCTYPE, {"electricity_type": "Test Type"})
+		super().tearDown()
@@ -0,0 +1,90 @@
+# Copyright (c) 2026, alipro and contributors
+# For license information, please see license.txt
+
+import frappe
+from erpnext.accounts.doctype.payment_entry.payment_entry import get_payment_entry
+from erpnext.accounts.doctype.sales_invoice.sales_invoice import make_sales_return
+
+from electricity_meter_management.electricity_meter_management.services.statements import get_statements
+from electricity_meter_management.electricity_meter_management.tests.utils import MeterMovementTestCase
+
+
+class TestCustomerStatement(MeterMovementTestCase):
+	"""Test statements built from readings, Sales Invoices and GL Entries"""
+
+	def test_statement_running_balance(self):
+		today = frappe.utils.today()
+		opening_balance = get_statements(["Test Customer"], today, today)["Test Customer"].closing_balance
+
+		self.make_meter_movement(submit=True, posting_date=today)
+
+		statement = get_statements(["Test Customer"], today, today)["Test Customer"]
+		invoice_line = statement.lines[-1]
+
+		self.assertEqual(invoice_line.debit, 500)
+		self.assertEqual(invoice_line.reading.current_reading, 150)
+		self.assertEqual(statement.closing_balance, opening_balance + 500)
+		self.assertEqual(statement.closing_balance, invoice_line.balance)
+
+	def make_sales_invoice(self):
+		meter_movement = self.make_meter_movement(submit=True, posting_date=frappe.utils.today())
+		meter_movement.reload()
+		return meter_movement.customer_table[0].custom_sales_invoice
+
+	def test_statement_payment(self):
+		today = frappe.utils.today()
+		sales_invoice = self.make_sales_invoice()
+		opening_balance = get_statements(["Test Customer"], today, today)["Test Customer"].closing_balance
+
+		payment_entry = get_payment_entry("Sales Invoice", sales_invoice)
+		payment_entry.reference_no = "_Test Statement Payment"
+		payment_entry.reference_date = today
+		payment_entry.insert().submit()
+
+		statement = get_statements(["Test Customer"], today, today)["Test Customer"]
+		payment_line = next(line for line in statement.lines if line.voucher_no == payment_entry.name)
+
+		self.assertEqual(payment_line.credit, 500)
+		self.assertIsNone(payment_line.reading)
+		self.assertEqual(statement.closing_balance, opening_balance - 500)
+
+	def test_statement_credit_note(self):
+		today = frappe.utils.today()
+		sales_invoice = self.make_sales_invoice()
+		opening_balance = get_statements(["Test Customer"], today, today)["Test Customer"].closing_balance
+
+		credit_note = make_sales_return(sales_invoice)
+		credit_note.insert().submit()
+
+		statement = get_statements(["Test Customer"], today, today)["Test Customer"]
+		invoice_line = next(line for line in statement.lines if line.voucher_no == sales_invoice)
+		credit_line = next(line for line in statement.lines if line.voucher_no == credit_note.name)
+
+		self.assertEqual(invoice_line.reading.current_reading, 150)
+		self.assertEqual(credit_line.credit, 500)
+		self.assertIsNone(credit_line.reading)
+		self.assertEqual(statement.closing_balance, opening_balance - 500)
+
+	def test_statement_without_activity(self):
+		customer = frappe.get_doc(
+			{
+				"doctype": "Customer",
+				"customer_name": "Statement Idle Customer",
+				"customer_type": "Individual",
+			}
+		).insert()
+		today = frappe.utils.today()
+
+		statement = get_statements([customer.name], today, today)[customer.name]
+
+		self.assertEqual(statement.lines, [])
+		self.assertEqual(statement.customer_name, "Statement Idle Customer")
+		self.assertEqual(
+			(
+				statement.opening_balance,
+				statement.total_debit,
+				statement.total_credit,
+				statement.closing_balance,
+			),
+			(0, 0, 0, 0),
+		)
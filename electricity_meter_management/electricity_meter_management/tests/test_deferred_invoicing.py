@@ -0,0 +1,101 @@
+# Copyright (c) 2026, alipro and contributors
+# For license information, please see license.txt
+
+from unittest.mock import patch
+
+import frappe
+from erpnext.accounts.doctype.sales_invoice.sales_invoice import SalesInvoice
+from rq.timeouts import JobTimeoutException
+
+from electricity_meter_management.electricity_meter_management.doctype.meter_movement.meter_movement import (
+	MeterMovement,
+)
+from electricity_meter_management.electricity_meter_management.services import invoicing
+from electricity_meter_management.electricity_meter_management.services.invoicing import (
+	submit_draft_sales_invoices,
+	submit_pending_draft_invoices,
+)
+from electricity_meter_management.electricity_meter_management.tests.utils import MeterMovementTestCase
+
+
+class TestDeferredInvoicing(MeterMovementTestCase):
+	"""Test the two-phase draft-then-batch-submit invoicing mode"""
+
+	def test_drafts_created_on_submit_and_submitted_in_batch(self):
+		meter_movement = self.make_meter_movement(submit=True, defer_invoice_submit=1)
+
+		sales_invoice_name = frappe.db.get_value(
+			"Meter Movement Table", {"parent": meter_movement.name}, "custom_sales_invoice"
+		)
+		self.assertEqual(frappe.db.get_value("Sales Invoice", sales_invoice_name, "docstatus"), 0)
+		self.assertEqual(
+			frappe.db.get_value("Meter Movement", meter_movement.name, "invoice_submission_status"), "Pending"
+		)
+
+		report = submit_draft_sales_invoices(meter_movement.name)
+
+		self.assertEqual(report["submitted"], 1)
+		self.assertEqual(report["status"], "Completed")
+		self.assertEqual(frappe.db.get_value("Sales Invoice", sales_invoice_name, "docstatus"), 1)
+
+	def get_submission_status(self, meter_movement):
+		return frappe.db.get_value("Meter Movement", meter_movement.name, "invoice_submission_status")
+
+	def test_interrupted_run_is_not_left_in_progress(self):
+		meter_movement = self.make_meter_movement(submit=True, defer_invoice_submit=1)
+
+		with patch.object(frappe, "publish_progress", side_effect=TimeoutError("job timed out")):
+			self.assertRaises(TimeoutError, submit_draft_sales_invoices, meter_movement.name)
+
+		self.assertEqual(self.get_submission_status(meter_movement), "Pending")
+
+	def test_job_timeout_in_submit_ends_the_run(self):
+		meter_movement = self.make_meter_movement(submit=True, defer_invoice_submit=1)
+
+		with patch.object(SalesInvoice, "submit", side_effect=JobTimeoutException("job timed out")):
+			self.assertRaises(JobTimeoutException, submit_draft_sales_invoices, meter_movement.name)
+
+		self.assertEqual(self.get_submission_status(meter_movement), "Pending")
+
+	def test_failed_submit_is_reported(self):
+		meter_movement = self.make_meter_movement(submit=True, defer_invoice_submit=1)
+
+		with patch.object(SalesInvoice, "submit", side_effect=frappe.ValidationError("closed period")):
+			report = submit_draft_sales_invoices(meter_movement.name)
+
+		self.assertEqual(report["status"], "Partly Failed")
+		self.assertEqual(len(report["failed"]), 1)
+		self.assertEqual(self.get_submission_status(meter_movement), "Partly Failed")
+
+	def test_failed_draft_is_created_by_the_submission_stage(self):
+		with patch.object(
+			MeterMovement, "create_sales_invoice_for_customer", side_effect=frappe.ValidationError("no price")
+		):
+			meter_movement = self.make_meter_movement(submit=True, defer_invoice_submit=1)
+
+		self.assertEqual(self.get_submission_status(meter_movement), "Partly Failed")
+		self.assertFalse(
+			frappe.db.get_value(
+				"Meter Movement Table", {"parent": meter_movement.name}, "custom_sales_invoice"
+			)
+		)
+
+		report = submit_draft_sales_invoices(meter_movement.name)
+
+		self.assertEqual(report["status"], "Completed")
+		sales_invoice_name = frappe.db.get_value(
+			"Meter Movement Table", {"parent": meter_movement.name}, "custom_sales_invoice"
+		)
+		self.assertEqual(frappe.db.get_value("Sales Invoice", sales_invoice_name, "docstatus"), 1)
+
+	def test_scheduler_enqueues_one_job_per_movement(self):
+		meter_movement = self.make_meter_movement(submit=True, defer_invoice_submit=1)
+		# a run that died after marking the movement
+		frappe.db.set_value("Meter Movement", meter_movement.name, "invoice_submission_status", "In Progress")
+
+		with patch.object(invoicing.frappe, "enqueue") as enqueue:
+			submit_pending_draft_invoices()
+
+		job_ids = [call.kwargs["job_id"] for call in enqueue.call_args_list]
+		self.assertIn(f"submit-drafts-{meter_movement.name}", job_ids)
+		self.assertTrue(all(call.kwargs["deduplicate"] for call in enqueue.call_args_list))
@@ -0,0 +1,229 @@
+# Copyright (c) 2026, alipro and contributors
+# For license information, please see license.txt
+
+"""Query counts of the Meter Movement hot paths, against the local stand-in site.
+
+Each workload runs at `SMALL_ROWS` and `LARGE_ROWS` customers; the number of calls of
+every (kind, doctype) may only grow by the per-row budget given to
+`assertQueriesDoNotScale`, which is zero unless the work is inherently per row
+(one Sales Invoice per customer). Runs without a bench, and is skipped by
+`bench run-tests`, whose frappe the stand-in must not replace:
+
+	python -m unittest electricity_meter_management.electricity_meter_management.tests.test_hot_paths
+"""
+
+import importlib
+import unittest
+
+from electricity_meter_management.electricity_meter_management.tests.fake_site import (
+	fake_site,
+	real_frappe_loaded,
+)
+
+METER_MOVEMENT_MODULE = (
+	"electricity_meter_management.electricity_meter_management.doctype.meter_movement.meter_movement"
+)
+
+SMALL_ROWS = 20
+LARGE_ROWS = 2000
+
+COMPANY = "Test Company"
+ELECTRICITY_TYPE = "Residential"
+ITEM = "Electricity"
+PREVIOUS_READING = 100
+CONSUMPTION = 25
+BALANCE = 50
+
+PER_SALES_INVOICE = {("insert", "Sales Invoice"): 1, ("submit", "Sales Invoice"): 1}
+
+
+def make_customers(site, count):
+	site.defaults["Company"] = COMPANY
+	site.db.insert_rows("Company", [{"name": COMPANY, "default_currency": "USD"}])
+	site.db.insert_rows(
+		"Electricity Type", [{"name": ELECTRICITY_TYPE, "item_name": ITEM, "price_per_kilo": 10}]
+	)
+
+	customers = [f"CUST-{i:05d}" for i in range(count)]
+	site.db.insert_rows(
+		"Customer",
+		[
+			{
+				"name": customer,
+				"customer_name": customer,
+				"disabled": 0,
+				"custom_electricity_type": ELECTRICITY_TYPE,
+				"custom_meter_number": i,
+				"custom_meter_reading": PREVIOUS_READING,
+				"default_price_list": "Standard Selling",
+			}
+			for i, customer in enumerate(customers)
+		],
+	)
+	site.db.insert_rows(
+		"GL Entry",
+		[
+			{
+				"name": f"GLE-{customer}",
+				"party_type": "Customer",
+				"party": customer,
+				"debit": BALANCE,
+				"credit": 0,
+				"is_cancelled": 0,
+				"docstatus": 1,
+			}
+			for customer in customers
+		],
+	)
+	return customers
+
+
+def get_meter_movement_module():
+	return importlib.import_module(METER_MOVEMENT_MODULE)
+
+
+def new_meter_movement(site, **kwargs):
+	"""A Meter Movement over the whole roster, as the form builds it, with readings entered"""
+	roster = get_meter_movement_module().get_customers_for_meter_movement(
+		ELECTRICITY_TYPE, limit_page_length=0
+	)
+	return site.frappe.get_doc(
+		{
+			"doctype": "Meter Movement",
+			"name1": "October",
+			"electricity_type": ELECTRICITY_TYPE,
+			"posting_date": "2026-10-01",
+			"from_date": "2026-09-01",
+			"to_date": "2026-09-30",
+			"customer_table": [
+				{
+					"customer_name": customer.customer_no,
+					"meter_number": customer.meter_number,
+					"previous_reading": customer.previous_reading,
+					"current_reading": customer.previous_reading + CONSUMPTION,
+					"price": customer.price_per_kilo,
+					"item_name": customer.item_name,
+					"balance": customer.balance,
+				}
+				for customer in roster
+			],
+			**kwargs,
+		}
+	)
+
+
+def get_customer_readings(site):
+	return set(site.frappe.get_all("Customer", pluck="custom_meter_reading"))
+
+
+@unittest.skipIf(real_frappe_loaded(), "runs against the local stand-in site, outside a bench")
+class TestHotPaths(unittest.TestCase):
+	"""Hot paths must not issue per-row queries"""
+
+	def measure(self, workload, rows):
+		"""Run `workload(site)` on a fresh site and measure the step it returns"""
+		with fake_site() as site:
+			make_customers(site, rows)
+			step = workload(site)
+			site.reset_queries()
+			step()
+			return site.query_counts()
+
+	def assertQueriesDoNotScale(self, workload, per_row=None):
+		per_row = per_row or {}
+		small, large = self.measure(workload, SMALL_ROWS), self.measure(workload, LARGE_ROWS)
+
+		for key in sorted(set(small) | set(large), key=str):
+			growth = large[key] - small[key]
+			self.assertLessEqual(
+				growth,
+				per_row.get(key, 0) * (LARGE_ROWS - SMALL_ROWS),
+				f"{key} calls grew from {small[key]} to {large[key]} between {SMALL_ROWS} and {LARGE_ROWS} rows",
+			)
+
+	def test_harness_catches_per_row_set_value(self):
+		def workload(site):
+			def set_readings():
+				for customer in site.frappe.get_all("Customer", pluck="name"):
+					site.frappe.db.set_value("Customer", customer, "custom_meter_reading", 0)
+
+			return set_readings
+
+		with self.assertRaises(AssertionError):
+			self.assertQueriesDoNotScale(workload)
+
+	def test_customer_roster(self):
+		def workload(site):
+			module = get_meter_movement_module()
+			return lambda: module.get_customers_for_meter_movement(ELECTRICITY_TYPE, limit_page_length=0)
+
+		self.assertQueriesDoNotScale(workload)
+
+	def test_customer_roster_values(self):
+		with fake_site() as site:
+			make_customers(site, SMALL_ROWS)
+			roster = get_meter_movement_module().get_customers_for_meter_movement(
+				ELECTRICITY_TYPE, limit_page_length=0
+			)
+
+		self.assertEqual(len(roster), SMALL_ROWS)
+		self.assertEqual({customer.balance for customer in roster}, {BALANCE})
+		self.assertEqual({customer.item_name for customer in roster}, {ITEM})
+
+	def test_insert(self):
+		self.assertQueriesDoNotScale(lambda site: new_meter_movement(site).insert)
+
+	def test_save_reading_edits(self):
+		def workload(site):
+			doc = new_meter_movement(site).insert()
+			for row in doc.customer_table:
+				row.current_reading += 1
+			return doc.save
+
+		self.assertQueriesDoNotScale(workload)
+
+	def test_submit(self):
+		self.assertQueriesDoNotScale(
+			lambda site: new_meter_movement(site).insert().submit, per_row=PER_SALES_INVOICE
+		)
+
+	def test_submit_with_deferred_invoices(self):
+		self.assertQueriesDoNotScale(
+			lambda site: new_meter_movement(site, defer_invoice_submit=1).insert().submit,
+			per_row={("insert", "Sales Invoice"): 1, ("savepoint", None): 1},
+		)
+
+	def test_submit_updates_readings_and_links(self):
+		with fake_site() as site:
+			make_customers(site, SMALL_ROWS)
+			doc = new_meter_movement(site).insert().submit()
+
+			self.assertEqual(get_customer_readings(site), {PREVIOUS_READING + CONSUMPTION})
+			links = site.frappe.get_all("Meter Movement Table", pluck="custom_sales_invoice")
+			self.assertEqual(len(set(links)), SMALL_ROWS)
+			self.assertEqual(set(links), {row.custom_sales_invoice for row in doc.customer_table})
+
+	def test_update_after_submit(self):
+		def workload(site):
+			doc = new_meter_movement(site, defer_invoice_submit=1).insert().submit()
+			for row in doc.customer_table:
+				row.remarks = "Corrected"
+			return doc.save
+
+		self.assertQueriesDoNotScale(
+			workload, per_row={("get_doc", "Sales Invoice"): 1, ("save", "Sales Invoice"): 1}
+		)
+
+	def test_cancel(self):
+		self.assertQueriesDoNotScale(
+			lambda site: new_meter_movement(site).insert().submit().cancel,
+			per_row={("get_doc", "Sales Invoice"): 1, ("cancel", "Sales Invoice"): 1},
+		)
+
+	def test_cancel_reverts_readings(self):
+		with fake_site() as site:
+			make_customers(site, SMALL_ROWS)
+			new_meter_movement(site).insert().submit().cancel()
+
+			self.assertEqual(get_customer_readings(site), {PREVIOUS_READING})
+			self.assertEqual(set(site.frappe.get_all("Sales Invoice", pluck="docstatus")), {2})
@@ -0,0 +1,88 @@
+# Copyright (c) 2026, alipro and contributors
+# For license information, please see license.txt
+
+import json
+import pkgutil
+import subprocess
+import sys
+
+from frappe.tests.utils import FrappeTestCase
+
+import electricity_meter_management
+
+# seconds an app module's import may take, including the modules it pulls in beyond
+# frappe's document model, which every doctype module needs anyway
+IMPORT_BUDGET = 0.1
+
+# modules that must stay unimported until first use
+LAZY_MODULES = ["frappe_mcp"]
+
+MEASURE_IMPORTS = """
+import json, sys
+import frappe
+import frappe.model.document
+for module in {modules!r}:
+	__import__(module)
+print(json.dumps([name for name in {lazy!r} if name in sys.modules]))
+"""
+
+
+def get_app_modules():
+	"""Every importable app module except tests and patches"""
+	modules = []
+	for module in pkgutil.walk_packages(
+		electricity_meter_management.__path__, prefix="electricity_meter_management."
+	):
+		if ".test" in module.name or ".patches" in module.name:
+			continue
+		modules.append(module.name)
+	return modules
+
+
+def measure_cold_imports(modules):
+	"""Import `modules` in one fresh interpreter that has already imported frappe.
+
+	Returns the cumulative import time of each app module from `-X importtime`, and
+	the lazy modules that got loaded.
+	"""
+	process = subprocess.run(
+		[
+			sys.executable,
+			"-X",
+			"importtime",
+			"-c",
+			MEASURE_IMPORTS.format(modules=modules, lazy=LAZY_MODULES),
+		],
+		capture_output=True,
+		text=True,
+		check=True,
+	)
+
+	import_times = {}
+	for line in process.stderr.splitlines():
+		# import time: self [us] | cumulative | imported package
+		if not line.startswith("import time:"):
+			continue
+		_self, cumulative, name = line.removeprefix("import time:").split("|")
+		if cumulative.strip().isdigit() and name.strip().startswith("electricity_meter_management"):
+			import_times[name.strip()] = int(cumulative) / 1e6
+
+	return import_times, json.loads(process.stdout.strip().splitlines()[-1])
+
+
+class TestImportTime(FrappeTestCase):
+	"""Keep cold imports of the app cheap so worker boot and first requests stay fast"""
+
+	@classmethod
+	def setUpClass(cls):
+		super().setUpClass()
+		cls.import_times, cls.lazy_modules_loaded = measure_cold_imports(get_app_modules())
+
+	def test_cold_import_budget(self):
+		for module, elapsed in self.import_times.items():
+			with self.subTest(module=module):
+				self.assertLess(elapsed, IMPORT_BUDGET, f"importing {module} took {elapsed:.3f}s")
+
+	def test_mcp_is_loaded_lazily(self):
+		self.assertIn("electricity_meter_management.mcp", self.import_times)
+		self.assertNotIn("frappe_mcp", self.lazy_modules_loaded)
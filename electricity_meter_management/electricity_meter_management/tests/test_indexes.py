@@ -0,0 +1,71 @@
+# Copyright (c) 2026, alipro and contributors
+# For license information, please see license.txt
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+
+from electricity_meter_management.electricity_meter_management.services.indexes import (
+	APP_QUERIES,
+	ensure_app_indexes,
+	get_index_health,
+)
+
+
+class TestIndexes(FrappeTestCase):
+	"""Test the app's lookup indexes and the meter number constraint"""
+
+	def test_index_health_after_install(self):
+		ensure_app_indexes()
+		health = get_index_health()
+
+		self.assertEqual(health["missing_indexes"], [])
+		self.assertEqual(health["duplicate_meter_numbers"], [])
+		self.assertEqual(set(health["plans"]), set(APP_QUERIES))
+
+	def test_meter_number_unique_per_active_customer(self):
+		first = frappe.get_doc(
+			{
+				"doctype": "Customer",
+				"customer_name": "Meter Owner A",
+				"customer_type": "Individual",
+				"custom_meter_number": 987654,
+			}
+		).insert()
+
+		second = frappe.get_doc(
+			{
+				"doctype": "Customer",
+				"customer_name": "Meter Owner B",
+				"customer_type": "Individual",
+				"custom_meter_number": 987654,
+			}
+		)
+		self.assertRaises(frappe.UniqueValidationError, second.insert)
+
+		# the number is free again once the first customer is disabled
+		first.disabled = 1
+		first.save()
+		second.insert()
+
+	def test_meter_number_unique_in_database(self):
+		ensure_app_indexes()
+		for customer_name in ("Meter Owner C", "Meter Owner D"):
+			frappe.get_doc(
+				{
+					"doctype": "Customer",
+					"customer_name": customer_name,
+					"customer_type": "Individual",
+				}
+			).insert()
+
+		frappe.db.set_value("Customer", "Meter Owner C", "custom_meter_number", 987655)
+		# writes that skip the Customer validate hook are rejected by the unique index
+		with self.assertRaises(Exception) as context:
+			frappe.db.set_value("Customer", "Meter Owner D", "custom_meter_number", 987655)
+		self.assertTrue(frappe.db.is_unique_key_violation(context.exception))
+
+		frappe.db.set_value("Customer", "Meter Owner C", "disabled", 1)
+		frappe.db.set_value("Customer", "Meter Owner D", "custom_meter_number", 987655)
+
+	def tearDown(self):
+		frappe.db.rollback()
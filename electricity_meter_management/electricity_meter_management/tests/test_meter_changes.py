@@ -0,0 +1,181 @@
+# Copyright (c) 2026, alipro and contributors
+# For license information, please see license.txt
+
+import frappe
+from frappe.utils import add_days, today
+
+from electricity_meter_management.electricity_meter_management.services.meter_changes import (
+	calculate_consumption,
+)
+from electricity_meter_management.electricity_meter_management.tests.utils import MeterMovementTestCase
+
+
+class TestMeterChanges(MeterMovementTestCase):
+	"""Test billing across meter replacements and rollovers"""
+
+	def make_readings(self, previous_reading, current_reading):
+		return self.make_meter_movement(
+			[self.make_row(previous_reading=previous_reading, current_reading=current_reading, balance=5.0)]
+		)
+
+	def test_calculate_consumption(self):
+		self.assertEqual(calculate_consumption(100, 150), 50)
+		self.assertEqual(calculate_consumption(150, 100), 0)
+		self.assertEqual(calculate_consumption(99950, 30, meter_digits=5), 80)
+		event = frappe._dict(old_final_reading=180, new_initial_reading=0)
+		self.assertEqual(calculate_consumption(100, 40, event), 120)
+
+	def test_replacement_billed_from_event(self):
+		event = frappe.get_doc(
+			{
+				"doctype": "Meter Change Event",
+				"customer": "Test Customer",
+				"event_type": "Replacement",
+				"old_meter_number": 12345,
+				"old_final_reading": 180,
+				"new_meter_number": 54321,
+				"new_initial_reading": 0,
+			}
+		).insert()
+
+		meter_movement = self.make_readings(100, 40)
+		row = meter_movement.customer_table[0]
+
+		self.assertEqual(row.difference, 120)
+		self.assertEqual(row.total, 1200)
+		self.assertEqual(row.total_all, 1205)
+		self.assertEqual(row.meter_change_event, event.name)
+		self.assertEqual(meter_movement.total_consumption, 120)
+
+	def test_replacement_rejects_meter_number_in_use(self):
+		other_customer = frappe.get_doc(
+			{
+				"doctype": "Customer",
+				"customer_name": "Test Customer Meter 54321",
+				"customer_type": "Individual",
+				"custom_meter_number": 54321,
+			}
+		).insert()
+		self.addCleanup(frappe.delete_doc, "Customer", other_customer.name, force=True)
+
+		with self.assertRaises(frappe.UniqueValidationError):
+			frappe.get_doc(
+				{
+					"doctype": "Meter Change Event",
+					"customer": "Test Customer",
+					"event_type": "Replacement",
+					"old_meter_number": 12345,
+					"old_final_reading": 180,
+					"new_meter_number": 54321,
+					"new_initial_reading": 0,
+				}
+			).insert()
+
+	def test_second_unbilled_event_is_rejected(self):
+		event = {
+			"doctype": "Meter Change Event",
+			"customer": "Test Customer",
+			"event_type": "Rollover",
+			"old_final_reading": 180,
+			"new_initial_reading": 0,
+		}
+		frappe.get_doc(event).insert()
+
+		with self.assertRaises(frappe.ValidationError):
+			frappe.get_doc(event).insert()
+
+	def test_billed_event_readings_are_locked(self):
+		event = frappe.get_doc(
+			{
+				"doctype": "Meter Change Event",
+				"customer": "Test Customer",
+				"event_type": "Rollover",
+				"old_final_reading": 180,
+				"new_initial_reading": 0,
+			}
+		).insert()
+		self.make_readings(100, 40).submit()
+
+		event.reload()
+		event.new_initial_reading = 10
+		with self.assertRaises(frappe.ValidationError):
+			event.save()
+
+	def test_event_after_the_period_is_not_billed(self):
+		event = frappe.get_doc(
+			{
+				"doctype": "Meter Change Event",
+				"customer": "Test Customer",
+				"event_type": "Rollover",
+				"event_date": add_days(today(), 5),
+				"old_final_reading": 180,
+				"new_initial_reading": 0,
+			}
+		).insert()
+
+		meter_movement = self.make_readings(100, 40)
+		self.assertIsNone(meter_movement.customer_table[0].meter_change_event)
+		self.assertEqual(meter_movement.customer_table[0].difference, 0)
+
+		meter_movement.to_date = add_days(today(), 10)
+		meter_movement.save()
+		self.assertEqual(meter_movement.customer_table[0].meter_change_event, event.name)
+
+	def test_event_is_claimed_by_one_meter_movement(self):
+		frappe.get_doc(
+			{
+				"doctype": "Meter Change Event",
+				"customer": "Test Customer",
+				"event_type": "Rollover",
+				"old_final_reading": 180,
+				"new_initial_reading": 0,
+			}
+		).insert()
+		self.make_readings(100, 40)
+
+		with self.assertRaises(frappe.ValidationError):
+			self.make_readings(100, 40)
+
+	def test_cancel_releases_event_next_to_a_newer_one(self):
+		event = frappe.get_doc(
+			{
+				"doctype": "Meter Change Event",
+				"customer": "Test Customer",
+				"event_type": "Rollover",
+				"old_final_reading": 180,
+				"new_initial_reading": 0,
+			}
+		).insert()
+		meter_movement = self.make_readings(100, 40)
+		meter_movement.submit()
+		frappe.get_doc(
+			{
+				"doctype": "Meter Change Event",
+				"customer": "Test Customer",
+				"event_type": "Rollover",
+				"old_final_reading": 90,
+				"new_initial_reading": 0,
+			}
+		).insert()
+
+		meter_movement.cancel()
+
+		self.assertIsNone(frappe.db.get_value("Meter Change Event", event.name, "meter_movement"))
+
+	def test_rollover_from_meter_digits(self):
+		frappe.db.set_value("Customer", "Test Customer", "custom_meter_digits", 4)
+
+		meter_movement = self.make_readings(9990, 15)
+
+		self.assertEqual(meter_movement.customer_table[0].difference, 25)
+
+	def test_reading_past_meter_digits_is_rejected(self):
+		with self.assertRaises(frappe.ValidationError):
+			calculate_consumption(10050, 30, meter_digits=4)
+		with self.assertRaises(frappe.ValidationError):
+			calculate_consumption(9990, 10015, meter_digits=4)
+
+	def tearDown(self):
+		frappe.db.delete("Meter Change Event", {"customer": "Test Customer"})
+		frappe.db.set_value("Customer", "Test Customer", {"custom_meter_digits": 0, "custom_meter_number": 0})
+		super().tearDown()
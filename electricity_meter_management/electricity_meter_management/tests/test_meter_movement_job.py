@@ -0,0 +1,68 @@
+# Copyright (c) 2026, alipro and contributors
+# For license information, please see license.txt
+
+import frappe
+
+from electricity_meter_management.electricity_meter_management.doctype.meter_movement.meter_movement import (
+	create_sales_invoices_for_meter_movement,
+)
+from electricity_meter_management.electricity_meter_management.services.jobs import (
+	CANCEL_SALES_INVOICES,
+	CREATE_SALES_INVOICES,
+	enqueue_meter_movement_job,
+	run_meter_movement_job,
+)
+from electricity_meter_management.electricity_meter_management.tests.utils import MeterMovementTestCase
+
+
+class TestMeterMovementJob(MeterMovementTestCase):
+	"""Test per-row results of the bulk Sales Invoice jobs"""
+
+	def setUp(self):
+		super().setUp()
+		self.meter_movement = self.make_meter_movement(submit=True)
+
+	def run_job(self, action):
+		job = frappe.get_doc(
+			{
+				"doctype": "Meter Movement Job",
+				"meter_movement": self.meter_movement.name,
+				"action": action,
+			}
+		).insert(ignore_permissions=True)
+		run_meter_movement_job(job.name)
+		return frappe.get_doc("Meter Movement Job", job.name)
+
+	def test_existing_invoices_are_skipped(self):
+		job = self.run_job(CREATE_SALES_INVOICES)
+
+		self.assertEqual(job.status, "Completed")
+		self.assertEqual(job.skipped_count, 1)
+		self.assertEqual(job.results[0].status, "Skipped")
+
+	def test_cancel_records_cancelled_rows(self):
+		job = self.run_job(CANCEL_SALES_INVOICES)
+
+		self.assertEqual(job.succeeded_count, 1)
+		self.assertEqual(job.results[0].status, "Cancelled")
+		self.assertEqual(frappe.db.get_value("Sales Invoice", job.results[0].sales_invoice, "docstatus"), 2)
+
+	def test_enqueue_returns_the_active_job(self):
+		job_name = enqueue_meter_movement_job(self.meter_movement.name, CREATE_SALES_INVOICES)
+
+		self.assertEqual(
+			enqueue_meter_movement_job(self.meter_movement.name, CREATE_SALES_INVOICES), job_name
+		)
+		self.assertNotEqual(
+			enqueue_meter_movement_job(self.meter_movement.name, CANCEL_SALES_INVOICES), job_name
+		)
+
+	def test_create_is_rejected_for_deferred_submission(self):
+		meter_movement = self.make_meter_movement(submit=True, defer_invoice_submit=1)
+
+		with self.assertRaises(frappe.ValidationError):
+			create_sales_invoices_for_meter_movement(meter_movement.name)
+
+	def tearDown(self):
+		frappe.db.delete("Meter Movement Job", {"meter_movement": self.meter_movement.name})
+		super().tearDown()
@@ -0,0 +1,45 @@
+# Copyright (c) 2026, alipro and contributors
+# For license information, please see license.txt
+
+import frappe
+
+from electricity_meter_management.electricity_meter_management.services.reading_audit import (
+	get_meter_reading_history,
+)
+from electricity_meter_management.electricity_meter_management.tests.utils import MeterMovementTestCase
+
+
+class TestReadingAudit(MeterMovementTestCase):
+	"""Test the compact audit trail of current reading edits"""
+
+	def test_reading_edits_are_logged(self):
+		meter_movement = self.make_meter_movement([self.make_row(meter_number=55501)])
+
+		meter_movement.customer_table[0].current_reading = 160
+		meter_movement.save()
+		# saving without changes adds no entry
+		meter_movement.save()
+
+		history = get_meter_reading_history(meter_number=55501)
+		self.assertEqual([(h.old_reading, h.new_reading) for h in history][:2], [(150, 160), (None, 150)])
+		self.assertEqual(history[0].user, frappe.session.user)
+		self.assertFalse(
+			frappe.db.exists("Version", {"ref_doctype": "Meter Movement", "docname": meter_movement.name})
+		)
+
+	def test_reading_edits_on_submit_are_logged(self):
+		meter_movement = self.make_meter_movement([self.make_row(meter_number=55501)])
+
+		meter_movement.customer_table[0].current_reading = 170
+		meter_movement.submit()
+
+		history = get_meter_reading_history(meter_number=55501)
+		self.assertEqual([(h.old_reading, h.new_reading) for h in history][:2], [(150, 170), (None, 150)])
+
+	def test_meter_reading_log_indexes(self):
+		for index_name in ("meter_number_timestamp_index", "customer_timestamp_index"):
+			self.assertTrue(frappe.db.has_index("tabMeter Reading Log", index_name))
+
+	def tearDown(self):
+		frappe.db.delete("Meter Reading Log", {"meter_number": 55501})
+		super().tearDown()
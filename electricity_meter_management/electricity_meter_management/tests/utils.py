@@ -0,0 +1,74 @@
+# Copyright (c) 2026, alipro and contributors
+# For license information, please see license.txt
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+
+TEST_CUSTOMER = "Test Customer"
+TEST_ITEM = "Test Electricity"
+TEST_ELECTRICITY_TYPE = "Test Type"
+
+
+class MeterMovementTestCase(FrappeTestCase):
+	"""Base for tests that bill the test customer through a Meter Movement"""
+
+	def setUp(self):
+		"""Set up test data"""
+		# Create test customer if not exists
+		if not frappe.db.exists("Customer", TEST_CUSTOMER):
+			customer = frappe.new_doc("Customer")
+			customer.customer_name = TEST_CUSTOMER
+			customer.customer_type = "Individual"
+			customer.custom_meter_reading = 100
+			customer.insert()
+
+		# Create test item if not exists
+		if not frappe.db.exists("Item", TEST_ITEM):
+			item = frappe.new_doc("Item")
+			item.item_code = TEST_ITEM
+			item.item_name = TEST_ITEM
+			item.item_group = "All Item Groups"
+			item.stock_uom = "Nos"
+			item.is_stock_item = 0
+			item.insert()
+
+		# Create test electricity type if not exists
+		if not frappe.db.exists("Electricity Type", TEST_ELECTRICITY_TYPE):
+			elec_type = frappe.new_doc("Electricity Type")
+			elec_type.name1 = TEST_ELECTRICITY_TYPE
+			elec_type.item_name = TEST_ITEM
+			elec_type.price_per_kilo = 10.0
+			elec_type.insert()
+
+	def make_row(self, **values):
+		"""A customer_table row for the test customer: 50 kWh at 10.0, overridable per field"""
+		return {
+			"customer_name": TEST_CUSTOMER,
+			"meter_number": 12345,
+			"previous_reading": 100,
+			"current_reading": 150,
+			"difference": 50,
+			"price": 10.0,
+			"total": 500.0,
+			"item_name": TEST_ITEM,
+			**values,
+		}
+
+	def make_meter_movement(self, rows=None, submit=False, **fields):
+		"""Insert (and optionally submit) a Meter Movement of the test type with `rows`"""
+		meter_movement = frappe.new_doc("Meter Movement")
+		meter_movement.posting_date = frappe.utils.today()
+		meter_movement.electricity_type = TEST_ELECTRICITY_TYPE
+		meter_movement.update(fields)
+		for row in rows or [self.make_row()]:
+			meter_movement.append("customer_table", row)
+
+		meter_movement.insert()
+		if submit:
+			meter_movement.submit()
+		return meter_movement
+
+	def tearDown(self):
+		"""Clean up test data; FrappeTestCase rolls the rest back after the class"""
+		frappe.db.delete("Meter Movement", {"electricity_type": TEST_ELECTRICITY_TYPE})
+		frappe.db.delete("Sales Invoice", {"custom_meter_movement": ["like", "%Test%"]})
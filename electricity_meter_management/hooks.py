@@ -43,7 +43,7 @@ app_license = "mit"
 # page_js = {"page" : "public/js/file.js"}
 
 # include js in doctype views
-# doctype_js = {"doctype" : "public/js/doctype.js"}
+doctype_js = {"Customer": "public/js/customer.js"}
 # doctype_list_js = {"doctype" : "public/js/doctype_list.js"}
 # doctype_tree_js = {"doctype" : "public/js/doctype_tree.js"}
 # doctype_calendar_js = {"doctype" : "public/js/doctype_calendar.js"}
@@ -83,7 +83,9 @@ app_license = "mit"
 # ------------
 
 # before_install = "electricity_meter_management.install.before_install"
-# after_install = "electricity_meter_management.install.after_install"
+after_install = (
+	"electricity_meter_management.electricity_meter_management.services.indexes.ensure_app_indexes"
+)
 
 # Uninstallation
 # ------------
@@ -137,34 +139,42 @@ app_license = "mit"
 # ---------------
 # Hook on document methods and events
 
-# doc_events = {
-# 	"*": {
-# 		"on_update": "method",
-# 		"on_cancel": "method",
-# 		"on_trash": "method"
-# 	}
-# }
+doc_events = {
+	"Customer": {
+		"validate": "electricity_meter_management.electricity_meter_management.services.customer.validate_unique_meter_number",
+	},
+}
 
 # Scheduled Tasks
 # ---------------
 
-# scheduler_events = {
-# 	"all": [
-# 		"electricity_meter_management.tasks.all"
-# 	],
-# 	"daily": [
-# 		"electricity_meter_management.tasks.daily"
-# 	],
-# 	"hourly": [
-# 		"electricity_meter_management.tasks.hourly"
-# 	],
-# 	"weekly": [
-# 		"electricity_meter_management.tasks.weekly"
-# 	],
-# 	"monthly": [
-# 		"electricity_meter_management.tasks.monthly"
-# 	],
-# }
+scheduler_events = {
+	"cron": {
+		# pre-create the draft Meter Movement of each billing cycle off-peak
+		"0 1 * * *": [
+			"electricity_meter_management.electricity_meter_management.services.billing_cycle.create_scheduled_meter_movements",
+		],
+		# submit deferred draft Sales Invoices off-peak
+		"0 2 * * *": [
+			"electricity_meter_management.electricity_meter_management.services.invoicing.submit_pending_draft_invoices",
+		],
+		# deliver queued bill notifications; channel rate limits are per minute
+		"* * * * *": [
+			"electricity_meter_management.electricity_meter_management.services.notifications.process_bill_notifications",
+		],
+	},
+}
+
+# Bill Notifications
+# ------------------
+# Delivery channels for customer bills, enabled per site with the
+# `bill_notification_channels` site config key
+
+bill_notification_channels = {
+	"email": "electricity_meter_management.electricity_meter_management.services.notifications.EmailChannel",
+	"sms": "electricity_meter_management.electricity_meter_management.services.notifications.SMSChannel",
+	"webhook": "electricity_meter_management.electricity_meter_management.services.notifications.WebhookChannel",
+}
 
 # Testing
 # -------
@@ -241,4 +251,3 @@ app_license = "mit"
 # default_log_clearing_doctypes = {
 # 	"Logging DocType Name": 30  # days to retain logs
 # }
-
@@ -1,16 +1,16 @@
 import frappe
-import frappe_mcp
+from frappe import _
 import json
 
-# تعريف الخادم باسم يدل على وظيفته الديناميكية
-mcp = frappe_mcp.MCP("delta_green_dynamic")
+# The MCP server is built on the first request to `handle_mcp`, so importing this
+# module (or `frappe_mcp` being absent) costs nothing for workers that never use it.
+_handler = None
 
 # ---------------------------------------------------------
 # Tool 1: Schema Inspector (مستكشف الهيكلية)
 # الوظيفة: يخبر Kiro عن الحقول الموجودة في أي جدول (مثل Employee)
 # لكي يعرف كيف يكتب كود Flutter الصحيح (Models).
 # ---------------------------------------------------------
-@mcp.tool()
 def get_doctype_schema(doctype: str):
     """
     Returns the schema metadata (fields, types, options) for any DocType.
@@ -47,7 +47,6 @@ def get_doctype_schema(doctype: str):
 # الوظيفة: جلب بيانات حقيقية من قاعدة البيانات لعمل اختبارات
 # أو لفهم شكل البيانات الراجعة (JSON Response).
 # ---------------------------------------------------------
-@mcp.tool()
 def search_documents(doctype: str, filters_json: str = None, limit: int = 5):
     """
     Fetches a list of documents from any DocType with optional filters.
@@ -80,7 +79,6 @@ def search_documents(doctype: str, filters_json: str = None, limit: int = 5):
 # الوظيفة: جلب مستند واحد مع جداوله الفرعية (Child Tables)
 # مفيد جداً لقسائم الراتب (Salary Slips) والفواتير.
 # ---------------------------------------------------------
-@mcp.tool()
 def get_document_details(doctype: str, name: str):
     """
     Fetches a single document completely, including Child Tables (line items).
@@ -102,10 +100,31 @@ def get_document_details(doctype: str, name: str):
 # التسجيل (Registration)
 # الوظيفة: فتح البوابة لـ Kiro للدخول
 # ---------------------------------------------------------
-@mcp.register(allow_guest=True)
+def _get_handler():
+    """Import `frappe_mcp`, register the tools and return the MCP request handler"""
+    global _handler
+    if _handler is None:
+        try:
+            import frappe_mcp
+        except ImportError:
+            frappe.throw(_("The frappe_mcp app is required to use the MCP endpoint"))
+
+        # تعريف الخادم باسم يدل على وظيفته الديناميكية
+        mcp = frappe_mcp.MCP("delta_green_dynamic")
+        for tool in (get_doctype_schema, search_documents, get_document_details):
+            mcp.tool()(tool)
+
+        def _entry_point():
+            pass
+
+        _handler = mcp.register(allow_guest=True)(_entry_point)
+    return _handler
+
+
+@frappe.whitelist(allow_guest=True, methods=["POST"])
 def handle_mcp():
     """
     MCP Entry Point.
     Kiro connects to: /api/method/electricity_metet_management.mcp.handle_mcp
     """
-    pass
\ No newline at end of file
+    return _get_handler()()
\ No newline at end of file
@@ -0,0 +1,7 @@
+from electricity_meter_management.electricity_meter_management.services.indexes import ensure_app_indexes
+
+
+def execute():
+	"""Index Customer, Sales Invoice and Meter Movement Table for the app's lookups and
+	allow a meter number on one active Customer only"""
+	ensure_app_indexes()
@@ -0,0 +1,8 @@
+from electricity_meter_management.electricity_meter_management.services.consumption_summary import (
+	rebuild_consumption_summary,
+)
+
+
+def execute():
+	"""Backfill Electricity Consumption Summary from already submitted Meter Movements"""
+	rebuild_consumption_summary()
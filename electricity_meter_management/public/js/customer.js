@@ -0,0 +1,42 @@
+// Copyright (c) 2026, alipro and contributors
+// For license information, please see license.txt
+
+frappe.ui.form.on("Customer", {
+	refresh(frm) {
+		if (frm.is_new()) return;
+
+		frm.add_custom_button(__("Customer Statement"), function () {
+			frappe.prompt(
+				[
+					{
+						fieldname: "from_date",
+						label: __("From Date"),
+						fieldtype: "Date",
+						reqd: 1,
+						default: frappe.datetime.year_start(),
+					},
+					{
+						fieldname: "to_date",
+						label: __("To Date"),
+						fieldtype: "Date",
+						reqd: 1,
+						default: frappe.datetime.get_today(),
+					},
+				],
+				function (values) {
+					const args = new URLSearchParams({
+						customer: frm.doc.name,
+						from_date: values.from_date,
+						to_date: values.to_date,
+					});
+					window.open(
+						"/api/method/electricity_meter_management.electricity_meter_management.services.statements.download_customer_statement?" +
+							args.toString()
+					);
+				},
+				__("Customer Statement"),
+				__("Download")
+			);
+		});
+	},
+});